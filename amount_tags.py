@@ -0,0 +1,60 @@
+"""
+UNIQUE-AMOUNT ORDER TAGGING
+===========================
+Gives every open order its own paise offset, so an order can be found
+from the amount alone (₹109.01 ... ₹109.99 for a ₹109 price).
+
+- Offsets come from a fixed pool (1-99 paise) and go back to it when
+  the order is approved or rejected, or when an expired order can no
+  longer be matched by /reconcile
+- Freed offsets are reused last-freed-last, so a number isn't handed
+  out again straight after a payment for it was abandoned
+- When every offset is in use, new orders just use the plain price
+"""
+
+from collections import deque
+
+# Paise offsets available (exclusive of 0 = untagged)
+POOL_SIZE = 99
+
+
+class AmountTagPool:
+    """Offset allocator: order_id <-> paise offset"""
+
+    def __init__(self, size=POOL_SIZE):
+        self.free = deque(range(1, size + 1))
+        self.by_order = {}
+
+    def __len__(self):
+        return len(self.by_order)
+
+    def allocate(self, order_id):
+        """Take a free offset for order_id; None if the pool is exhausted"""
+        if order_id in self.by_order:
+            return self.by_order[order_id]
+        if not self.free:
+            return None
+        offset = self.free.popleft()
+        self.by_order[order_id] = offset
+        return offset
+
+    def reserve(self, order_id, offset):
+        """Mark an offset as taken (rebuilding from stored orders)"""
+        try:
+            self.free.remove(offset)
+        except ValueError:
+            return False
+        self.by_order[order_id] = offset
+        return True
+
+    def release(self, order_id):
+        """Give order_id's offset back to the pool"""
+        offset = self.by_order.pop(order_id, None)
+        if offset is not None:
+            self.free.append(offset)
+        return offset
+
+
+def tagged_amount(price, offset):
+    """Price plus offset paise, in rupees (2 decimals)"""
+    return round(price + offset / 100, 2)
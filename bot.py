@@ -16,17 +16,35 @@ import qrcode
 import io
 import json
 import time
+import asyncio
+from collections import OrderedDict
+import runpy
+import tempfile
 from datetime import datetime, timedelta
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ChatMember, InputMediaPhoto, InputMediaDocument
+from telegram.error import Forbidden
 from telegram.ext import (
     Application,
-    CommandHandler,
-    CallbackQueryHandler,
-    MessageHandler,
     filters,
     ContextTypes,
 )
 import os
+import sys
+
+import broadcast
+import export
+import membership_audit
+import reconcile
+import shared
+from member_index import MemberIndex
+from router import Router, encode, decode, Metrics, timing, capture_errors, admin_only, throttle
+from throttle import TokenBucketLimiter
+import intake
+import loop_monitor
+from records import OrderRecord, MemberRecord, load_records, json_default, format_time, to_iso
+from messages import Catalog, escape_markdown
+from reviewers import ReviewerPool, STRATEGIES
+from amount_tags import AmountTagPool, tagged_amount
 
 # Import config
 try:
@@ -35,9 +53,48 @@ except ImportError:
     print("❌ Error: config.py not found!")
     exit(1)
 
+# Per-bot settings, injected by multibot.py before this module runs
+globals().update(globals().get('BOT_OVERRIDES', {}))
+
+# Defaults for settings missing from older config.py files
+CONFIG_DEFAULTS = {
+    'RECONCILE_WINDOW_HOURS': 24,
+    'RECONCILE_AUTO_APPLY': False,
+    'MEMBERS_PAGE_SIZE': 20,
+    'AUDIT_INTERVAL_HOURS': 24,
+    'AUDIT_BATCH_SIZE': 100,
+    'AUDIT_CONCURRENCY': 5,
+    'AUDIT_BATCH_DELAY_SECONDS': 2,
+    'THROTTLE_RULES': {
+        'access': (3, 30),
+        'paid': (3, 30),
+        'screenshot': (5, 60),
+    },
+    'INTAKE_WORKERS': 4,
+    'INTAKE_MAX_QUEUED': 500,
+    'STALE_CALLBACK_MINUTES': 10,
+    'APPROVAL_RETRY_MINUTES': 10,
+    'APPROVAL_MAX_NOTIFY_ATTEMPTS': 5,
+    'DEFAULT_LANGUAGE': 'en',
+    'BROADCAST_RATE_PER_SECOND': 20,
+    'BROADCAST_CONCURRENCY': 10,
+    'BROADCAST_BATCH_SIZE': 100,
+    'LOOP_LAG_THRESHOLD_MS': 200,
+    'PROFILE_MAX_SECONDS': 60,
+    'DATA_DIR': 'data',
+    'BOT_NAME': "Premium Membership Bot",
+    'ADMIN_USERNAME': "@admin",
+    'ADMIN_CHAT_IDS': [],
+    'REVIEW_ASSIGNMENT': 'least_loaded',
+    'REVIEW_LEASE_MINUTES': 30,
+    'UNIQUE_AMOUNT_TAGGING': False,
+}
+for _name, _value in CONFIG_DEFAULTS.items():
+    globals().setdefault(_name, _value)
+
 # Setup logging
 os.makedirs('logs', exist_ok=True)
-os.makedirs('data', exist_ok=True)
+os.makedirs(DATA_DIR, exist_ok=True)
 
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -50,9 +107,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Database files
-ORDERS_FILE = 'data/orders.json'
-MEMBERS_FILE = 'data/members.json'
-INVITE_LINKS_FILE = 'data/invite_links.json'
+ORDERS_FILE = os.path.join(DATA_DIR, 'orders.json')
+MEMBERS_FILE = os.path.join(DATA_DIR, 'members.json')
+INVITE_LINKS_FILE = os.path.join(DATA_DIR, 'invite_links.json')
+AUDIT_FILE = os.path.join(DATA_DIR, 'audit.json')
+BROADCAST_FILE = os.path.join(DATA_DIR, 'broadcast.json')
+REVIEWERS_FILE = os.path.join(DATA_DIR, 'reviewers.json')
+
+# Update types the bot handles (everything else is never fetched)
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY, Update.CHAT_MEMBER]
 
 def load_db(filename, default=None):
     """Load JSON database"""
@@ -66,19 +129,110 @@ def save_db(filename, data):
     """Save JSON database"""
     try:
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+            json.dump(data, f, indent=2, default=json_default)
     except Exception as e:
         logger.error(f"Error saving {filename}: {e}")
 
 # Initialize databases
-orders_db = load_db(ORDERS_FILE, {})
-members_db = load_db(MEMBERS_FILE, {})
+orders_db = load_records(load_db(ORDERS_FILE, {}), OrderRecord)
+members_db = load_records(load_db(MEMBERS_FILE, {}), MemberRecord)
 invite_links_db = load_db(INVITE_LINKS_FILE, {})
+for _link in invite_links_db.values():
+    if isinstance(_link.get('username'), str):
+        _link['username'] = sys.intern(_link['username'])
+audit_state = {**membership_audit.new_state(), **load_db(AUDIT_FILE, {})}
+broadcast_job = load_db(BROADCAST_FILE, {})
+
+# Search/pagination index over members
+member_index = MemberIndex()
+member_index.build(members_db)
+
+# Invite link name/URL -> invite_links_db key
+invite_link_index = {}
+for _key, _link in invite_links_db.items():
+    if _link.get('name'):
+        invite_link_index[_link['name']] = _key
+    if _link.get('link'):
+        invite_link_index[_link['link']] = _key
+
+# Orders waiting for a screenshot review, oldest upload first (/review)
+review_queue = OrderedDict(
+    (order_id, None) for order_id, order in sorted(
+        orders_db.items(), key=lambda item: item[1].get('screenshot_time') or 0
+    )
+    if order['status'] == 'pending' and order.get('screenshot_file_id')
+)
+
+
+# Paise offsets held by open orders (UNIQUE_AMOUNT_TAGGING); expired
+# orders keep theirs until /reconcile can no longer match them
+amount_tags = AmountTagPool()
+_tag_cutoff = time.time() - RECONCILE_WINDOW_HOURS * 3600
+for _key, _order in orders_db.items():
+    if not _order.get('amount_tag'):
+        continue
+    if _order['status'] == 'pending' or (_order['status'] == 'expired' and _order['created_at'] >= _tag_cutoff):
+        if not amount_tags.reserve(_key, _order['amount_tag']):
+            logger.warning(f"⚠️ {_key} shares its amount with another open order")
+
+
+def admin_ids(settings):
+    """Reviewer chat IDs: ADMIN_CHAT_ID first, then ADMIN_CHAT_IDS"""
+    ids = [settings.get('ADMIN_CHAT_ID'), *settings.get('ADMIN_CHAT_IDS', [])]
+    return list(dict.fromkeys(str(i) for i in ids if i is not None))
+
+
+# Admin set (is_admin is one set lookup) and the pool sharing reviews
+ADMIN_IDS = frozenset(admin_ids(globals()))
+_reviewers_data = load_db(REVIEWERS_FILE, {})
+if 'stats' not in _reviewers_data:
+    # Older files hold only the stats
+    _reviewers_data = {'stats': _reviewers_data, 'leases': {}}
+reviewer_pool = ReviewerPool(
+    admin_ids(globals()),
+    strategy=REVIEW_ASSIGNMENT,
+    lease_seconds=REVIEW_LEASE_MINUTES * 60,
+    stats=_reviewers_data['stats']
+)
+reviewer_pool.restore_leases({
+    order_id: lease for order_id, lease in _reviewers_data.get('leases', {}).items()
+    if order_id in review_queue
+})
+
+
+def save_reviewers():
+    """Persist reviewer stats and open leases"""
+    save_db(REVIEWERS_FILE, {'stats': reviewer_pool.stats, 'leases': reviewer_pool.export_leases()})
+
+
+def compile_catalog(settings):
+    """Build the message catalog from a config namespace"""
+    return Catalog({
+        'bot_name': settings['BOT_NAME'],
+        'price': settings['MEMBERSHIP_PRICE'],
+        'admin_username': settings['ADMIN_USERNAME'],
+        'admin_url': f"https://t.me/{settings['ADMIN_USERNAME'].replace('@', '')}",
+        'expiry_hours': settings['INVITE_LINK_EXPIRY_HOURS'],
+        'upi_id': settings['UPI_ID'],
+    }, default_locale=settings['DEFAULT_LANGUAGE'])
+
+
+# User-facing texts and keyboards (see messages.py)
+catalog = compile_catalog(globals())
+
+
+def user_locale(user):
+    """Catalog locale for a Telegram user"""
+    return catalog.locale_for(getattr(user, 'language_code', None))
 
 
 def generate_order_id():
     """Generate unique order ID"""
-    return f"ORD{int(time.time())}"
+    stamp = int(time.time())
+    # Two orders in the same second must not share an ID
+    while f"ORD{stamp}" in orders_db:
+        stamp += 1
+    return f"ORD{stamp}"
 
 
 def generate_qr_code(upi_string):
@@ -97,32 +251,45 @@ def generate_qr_code(upi_string):
         return None
 
 
+async def render_qr_code(upi_string):
+    """generate_qr_code on the shared QR worker pool (keeps the loop free)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(shared.qr_executor(), generate_qr_code, upi_string)
+
+
+def format_amount(amount):
+    """Rupees for display: 109 or 109.37"""
+    return str(int(amount)) if amount == int(amount) else f"{amount:.2f}"
+
+
 def create_upi_string(order_id, amount):
     """Create UPI payment string"""
     return (
         f"upi://pay?"
         f"pa={UPI_ID}&"
         f"pn={MERCHANT_NAME}&"
-        f"am={amount}&"
+        f"am={amount:.2f}&"
         f"tn=Order%20{order_id}&"
         f"cu=INR"
     )
 
 
-async def create_single_use_invite_link(context, user_id, username, order_id):
+async def create_single_use_invite_link(bot, user_id, username, order_id):
     """Create one-time invite link"""
     try:
         expiry_date = datetime.now() + timedelta(hours=INVITE_LINK_EXPIRY_HOURS)
         
-        invite_link = await context.bot.create_chat_invite_link(
+        link_name = f"User_{user_id}_{int(time.time())}"
+        invite_link = await bot.create_chat_invite_link(
             chat_id=PREMIUM_CHANNEL_ID,
             expire_date=int(expiry_date.timestamp()),
             member_limit=1,
-            name=f"User_{user_id}_{int(time.time())}"
+            name=link_name
         )
         
         invite_links_db[str(user_id)] = {
             'link': invite_link.invite_link,
+            'name': link_name,
             'order_id': order_id,
             'created_at': datetime.now().isoformat(),
             'expires_at': expiry_date.isoformat(),
@@ -130,6 +297,8 @@ async def create_single_use_invite_link(context, user_id, username, order_id):
             'username': username
         }
         save_db(INVITE_LINKS_FILE, invite_links_db)
+        invite_link_index[link_name] = str(user_id)
+        invite_link_index[invite_link.invite_link] = str(user_id)
         
         logger.info(f"✅ Link created for user {user_id}")
         return invite_link.invite_link
@@ -138,6 +307,32 @@ async def create_single_use_invite_link(context, user_id, username, order_id):
         return None
 
 
+def find_invite_link_record(chat_invite_link):
+    """Map a ChatInviteLink back to its invite_links_db key"""
+    key = invite_link_index.get(chat_invite_link.name) or invite_link_index.get(chat_invite_link.invite_link)
+    if key:
+        return key
+    
+    # Links created before names were stored: User_{user_id}_{ts}
+    parts = (chat_invite_link.name or '').split('_')
+    if len(parts) == 3 and parts[0] == 'User' and parts[1] in invite_links_db:
+        return parts[1]
+    return None
+
+
+def find_pending_order(user_id):
+    """Return the user's pending order ID, if any"""
+    for order_id, order in orders_db.items():
+        if order['user_id'] == user_id and order['status'] == 'pending':
+            return order_id
+    return None
+
+
+def is_admin(user_id):
+    """Check if user is admin"""
+    return str(user_id) in ADMIN_IDS
+
+
 def is_member(user_id):
     """Check if user is member"""
     return str(user_id) in members_db
@@ -145,124 +340,49 @@ def is_member(user_id):
 
 def add_member(user_id, username, order_id):
     """Add member to database"""
-    members_db[str(user_id)] = {
-        'username': username,
-        'order_id': order_id,
-        'joined_at': datetime.now().isoformat(),
-        'active': True
-    }
+    members_db[str(user_id)] = MemberRecord(
+        username=username,
+        order_id=order_id,
+        joined_at=int(time.time()),
+        active=True
+    )
     save_db(MEMBERS_FILE, members_db)
+    member_index.add(user_id, username)
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start"""
     user = update.effective_user
+    locale = user_locale(user)
     
     if is_member(user.id):
+        # Talking to the bot again means it is no longer blocked
+        if members_db[str(user.id)].pop('blocked', None):
+            save_db(MEMBERS_FILE, members_db)
+        
         user_link_data = invite_links_db.get(str(user.id), {})
         invite_link = user_link_data.get('link', PREMIUM_CHANNEL_LINK)
         
         await update.message.reply_text(
-            f"✅ *You Already Have Access!*\n\n"
-            f"🔗 Your link:\n{invite_link}\n\n"
-            f"Contact: {ADMIN_USERNAME}",
+            catalog.text(locale, 'already_member', invite_link=invite_link),
             parse_mode='Markdown',
             protect_content=True
         )
         return
     
-    welcome_message = f"""
-🎉 *Welcome to {BOT_NAME}!* 🎉
-
-Hello {user.first_name}! 👋
-
-Get *Lifetime Premium Access* for just *₹{MEMBERSHIP_PRICE}*! 🚀
-
-✨ *What You'll Get:*
-• 📚 Exclusive premium content
-• ♾️ Lifetime access
-• 🎯 Fast approval (within hours)
-• 🔄 Regular updates
-
-💳 *Payment Process:*
-1️⃣ Click "Join Membership"
-2️⃣ Pay ₹{MEMBERSHIP_PRICE} via UPI
-3️⃣ Send payment screenshot
-4️⃣ Admin approves
-5️⃣ Get instant access!
-
-Ready to join? 👇
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton("🚀 Join Membership", callback_data='join_membership')],
-        [InlineKeyboardButton("ℹ️ How It Works", callback_data='how_it_works')],
-        [InlineKeyboardButton("📞 Contact Admin", callback_data='contact_admin')],
-    ]
-    
     await update.message.reply_text(
-        welcome_message,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        catalog.text(locale, 'welcome', first_name=user.first_name),
+        reply_markup=catalog.keyboard(locale, 'main'),
         parse_mode='Markdown',
         protect_content=True
     )
 
 
-async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle buttons"""
-    query = update.callback_query
-    await query.answer()
-    
-    if query.data == 'join_membership':
-        await show_membership_plan(query, context)
-    elif query.data == 'get_access':
-        await initiate_payment(query, context)
-    elif query.data.startswith('confirm_payment_'):
-        order_id = query.data.replace('confirm_payment_', '')
-        await request_screenshot(query, context, order_id)
-    elif query.data == 'contact_admin':
-        await contact_admin(query, context)
-    elif query.data == 'how_it_works':
-        await show_how_it_works(query, context)
-    elif query.data == 'back_main':
-        await back_to_main(query, context)
-
-
 async def show_how_it_works(query, context):
     """Show instructions"""
-    message = f"""
-❓ *How It Works*
-
-*Step 1: Join Membership*
-Click "Join Membership" button
-
-*Step 2: Get QR Code*
-Click "Get Access Now" to see payment QR
-
-*Step 3: Pay via UPI*
-Scan QR with any UPI app and pay ₹{MEMBERSHIP_PRICE}
-
-*Step 4: Send Screenshot*
-Click "✅ I Have Paid" and send payment screenshot
-
-*Step 5: Admin Approval*
-Admin verifies payment (usually within 1-2 hours)
-
-*Step 6: Get Access*
-After approval, you get one-time invite link
-
-*Step 7: Join Channel*
-Click link and join premium channel!
-
-⚡ *Safe & Secure!* Admin verifies every payment.
-
-🔒 *One-time links* - Cannot be shared.
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton("🚀 Get Started", callback_data='join_membership')],
-        [InlineKeyboardButton("🔙 Back", callback_data='back_main')],
-    ]
+    locale = user_locale(query.from_user)
+    message = catalog.text(locale, 'how_it_works')
+    keyboard = catalog.keyboard(locale, 'how_it_works')
     
     # Check if message has text (text message) or photo (photo message)
     if query.message.text:
@@ -270,7 +390,7 @@ Click link and join premium channel!
         try:
             await query.edit_message_text(
                 message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown'
             )
         except Exception as e:
@@ -286,7 +406,7 @@ Click link and join premium channel!
             await context.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown',
                 protect_content=True
             )
@@ -297,11 +417,12 @@ Click link and join premium channel!
 async def show_membership_plan(query, context):
     """Show plan"""
     user_id = query.from_user.id
+    locale = user_locale(query.from_user)
     
     if is_member(user_id):
         try:
             await query.edit_message_text(
-                "✅ You already have access!",
+                catalog.text(locale, 'already_access'),
                 parse_mode='Markdown'
             )
         except:
@@ -310,50 +431,20 @@ async def show_membership_plan(query, context):
             except:
                 pass
             await query.message.reply_text(
-                "✅ You already have access!",
+                catalog.text(locale, 'already_access'),
                 parse_mode='Markdown',
                 protect_content=True
             )
         return
     
-    message = f"""
-💎 *LIFETIME MEMBERSHIP* 💎
-
-*Price: ₹{MEMBERSHIP_PRICE}* (One-time)
-
-✅ *Included:*
-• 📚 All premium content
-• ♾️ Lifetime access
-• ⚡ Fast approval
-• 🎯 Priority support
-• 🔄 Updates
-
-💳 *Payment:*
-• Secure UPI
-• Any UPI app works
-• Screenshot verification
-• Admin approval
-
-🔒 *Security:*
-• Manual verification
-• One-time links
-• {INVITE_LINK_EXPIRY_HOURS}h validity
-• Safe & secure
-
-Ready?
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton(f"💳 Get Access - ₹{MEMBERSHIP_PRICE}", callback_data='get_access')],
-        [InlineKeyboardButton("❓ How It Works", callback_data='how_it_works')],
-        [InlineKeyboardButton("🔙 Back", callback_data='back_main')],
-    ]
+    message = catalog.text(locale, 'plan')
+    keyboard = catalog.keyboard(locale, 'plan')
     
     try:
         # Try to edit text message
         await query.edit_message_text(
             message,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=keyboard,
             parse_mode='Markdown'
         )
     except:
@@ -364,7 +455,7 @@ Ready?
             pass
         await query.message.reply_text(
             message,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=keyboard,
             parse_mode='Markdown',
             protect_content=True
         )
@@ -376,23 +467,34 @@ async def initiate_payment(query, context):
     username = query.from_user.username or query.from_user.first_name
     
     # Check for existing pending order
-    for order_id, order in orders_db.items():
-        if order['user_id'] == user_id and order['status'] == 'pending':
-            await show_payment_screen(query, context, order_id, order)
-            return
+    order_id = find_pending_order(user_id)
+    if order_id:
+        await show_payment_screen(query, context, order_id, orders_db[order_id])
+        return
     
     # Create new order
     order_id = generate_order_id()
     
-    orders_db[order_id] = {
-        'user_id': user_id,
-        'username': username,
-        'first_name': query.from_user.first_name,
-        'amount': MEMBERSHIP_PRICE,
-        'status': 'pending',
-        'created_at': datetime.now().isoformat(),
-        'screenshot_uploaded': False
-    }
+    orders_db[order_id] = OrderRecord(
+        user_id=user_id,
+        username=username,
+        first_name=query.from_user.first_name,
+        amount=MEMBERSHIP_PRICE,
+        status='pending',
+        created_at=int(time.time()),
+        screenshot_uploaded=False,
+        language=user_locale(query.from_user)
+    )
+    
+    # Distinct amount (₹109.37) so the payment matches this order alone
+    if UNIQUE_AMOUNT_TAGGING:
+        offset = amount_tags.allocate(order_id)
+        if offset:
+            orders_db[order_id]['amount'] = tagged_amount(MEMBERSHIP_PRICE, offset)
+            orders_db[order_id]['amount_tag'] = offset
+        else:
+            logger.warning(f"⚠️ All amount tags in use, {order_id} uses the plain price")
+    
     save_db(ORDERS_FILE, orders_db)
     
     logger.info(f"📦 Order {order_id} created by {username}")
@@ -402,49 +504,30 @@ async def initiate_payment(query, context):
 
 async def show_payment_screen(query, context, order_id, order):
     """Display QR code"""
+    locale = user_locale(query.from_user)
     
     upi_string = create_upi_string(order_id, order['amount'])
-    qr_image = generate_qr_code(upi_string)
+    qr_image = await render_qr_code(upi_string)
     
     if not qr_image:
         await query.message.reply_text(
-            f"❌ Error! Contact: {ADMIN_USERNAME}",
+            catalog.text(locale, 'qr_error'),
             parse_mode='Markdown'
         )
         return
     
-    payment_message = f"""
-💳 *PAYMENT DETAILS*
-
-📋 *Order ID:* `{order_id}`
-💰 *Amount:* ₹{order['amount']}
-
-*📱 INSTRUCTIONS:*
-
-1️⃣ Scan QR code with UPI app
-2️⃣ Pay ₹{order['amount']}
-3️⃣ Take screenshot of payment
-4️⃣ Click "✅ I Have Paid" below
-5️⃣ Send screenshot to bot
-6️⃣ Wait for admin approval
-
-*⏰ Approval Time:* 1-2 hours
-
-*UPI ID:* `{UPI_ID}`
-
-*Need help?* {ADMIN_USERNAME}
-"""
+    payment_message = catalog.text(locale, 'payment', order_id=order_id, amount=format_amount(order['amount']))
     
-    keyboard = [
-        [InlineKeyboardButton("✅ I Have Paid", callback_data=f'confirm_payment_{order_id}')],
-        [InlineKeyboardButton("📞 Contact Admin", callback_data='contact_admin')],
-    ]
+    keyboard = InlineKeyboardMarkup([
+        [InlineKeyboardButton(catalog.text(locale, 'btn_paid'), callback_data=encode('paid', order_id))],
+        [InlineKeyboardButton(catalog.text(locale, 'btn_contact'), callback_data='contact')],
+    ])
     
     try:
         await query.message.reply_photo(
             photo=qr_image,
             caption=payment_message,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=keyboard,
             parse_mode='Markdown',
             protect_content=True
         )
@@ -455,19 +538,20 @@ async def show_payment_screen(query, context, order_id, order):
 async def request_screenshot(query, context, order_id):
     """Request payment screenshot"""
     user_id = query.from_user.id
+    locale = user_locale(query.from_user)
     
     if order_id not in orders_db:
-        await query.answer("❌ Order not found!", show_alert=True)
+        await query.answer(catalog.text(locale, 'order_not_found'), show_alert=True)
         return
     
     order = orders_db[order_id]
     
     if order['user_id'] != user_id:
-        await query.answer("❌ Not your order!", show_alert=True)
+        await query.answer(catalog.text(locale, 'not_your_order'), show_alert=True)
         return
     
     if order['status'] == 'approved':
-        await query.answer("✅ Already approved!", show_alert=True)
+        await query.answer(catalog.text(locale, 'already_approved'), show_alert=True)
         return
     
     # Update order
@@ -477,23 +561,7 @@ async def request_screenshot(query, context, order_id):
     # Store order_id in context for screenshot handler
     context.user_data['waiting_order_id'] = order_id
     
-    message = f"""
-📸 *SEND PAYMENT SCREENSHOT*
-
-Please send a clear screenshot of your payment.
-
-*Order ID:* `{order_id}`
-*Amount:* ₹{order['amount']}
-
-⏳ *After sending:*
-Admin will verify and approve within 1-2 hours.
-
-*Need help?* {ADMIN_USERNAME}
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton("🔙 Back", callback_data='back_main')],
-    ]
+    message = catalog.text(locale, 'send_screenshot', order_id=order_id, amount=format_amount(order['amount']))
     
     # Get chat_id before deleting
     chat_id = query.message.chat_id
@@ -509,7 +577,7 @@ Admin will verify and approve within 1-2 hours.
         await context.bot.send_message(
             chat_id=chat_id,
             text=message,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=catalog.keyboard(locale, 'back'),
             parse_mode='Markdown',
             protect_content=True
         )
@@ -523,7 +591,7 @@ Admin will verify and approve within 1-2 hours.
             text=f"⏳ *Payment Screenshot Requested*\n\n"
                  f"📋 Order: `{order_id}`\n"
                  f"👤 User: {order['first_name']} (@{order['username']})\n"
-                 f"💰 Amount: ₹{order['amount']}\n\n"
+                 f"💰 Amount: ₹{format_amount(order['amount'])}\n\n"
                  f"Waiting for screenshot...",
             parse_mode='Markdown'
         )
@@ -531,15 +599,29 @@ Admin will verify and approve within 1-2 hours.
         logger.error(f"Could not notify admin: {e}")
 
 
+def reopen_amount_tag(order_id):
+    """Take back a reopened order's amount tag, if no one else has it"""
+    tag = orders_db[order_id].get('amount_tag')
+    if not tag or order_id in amount_tags.by_order:
+        return
+    if not amount_tags.reserve(order_id, tag):
+        logger.warning(
+            f"⚠️ {order_id} reopened but ₹{format_amount(orders_db[order_id]['amount'])} "
+            f"is now used by another order: its amount is no longer unique"
+        )
+
+
 async def handle_screenshot(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle screenshot upload"""
     user_id = update.effective_user.id
-    username = update.effective_user.username or update.effective_user.first_name
     
     # Check if waiting for screenshot
     order_id = context.user_data.get('waiting_order_id')
     if not order_id:
-        return
+        # user_data doesn't survive restarts; the order flag does
+        order_id = find_pending_order(user_id)
+        if not order_id or not orders_db[order_id].get('waiting_screenshot'):
+            return
     
     if order_id not in orders_db:
         return
@@ -549,66 +631,221 @@ async def handle_screenshot(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if order['user_id'] != user_id:
         return
     
+    # Paid after the request expired, or re-paid after a rejection: back to review
+    if order['status'] in ('expired', 'rejected'):
+        orders_db[order_id]['status'] = 'pending'
+        reopen_amount_tag(order_id)
+    
     # Mark screenshot received
     orders_db[order_id]['screenshot_uploaded'] = True
-    orders_db[order_id]['screenshot_time'] = datetime.now().isoformat()
+    orders_db[order_id]['screenshot_time'] = int(time.time())
+    if update.message.photo:
+        orders_db[order_id]['screenshot_file_id'] = update.message.photo[-1].file_id
+        orders_db[order_id]['screenshot_type'] = 'photo'
+    else:
+        orders_db[order_id]['screenshot_file_id'] = update.message.document.file_id
+        orders_db[order_id]['screenshot_type'] = 'document'
+    orders_db[order_id].pop('waiting_screenshot', None)
     save_db(ORDERS_FILE, orders_db)
+    review_queue[order_id] = None
     
     # Clear waiting status
     context.user_data.pop('waiting_order_id', None)
     
     # Confirm to user
     await update.message.reply_text(
-        f"✅ *Screenshot Received!*\n\n"
-        f"📋 Order: `{order_id}`\n\n"
-        f"⏳ Your payment is under review.\n"
-        f"Admin will approve within 1-2 hours.\n\n"
-        f"You'll get a notification when approved!\n\n"
-        f"Thank you for your patience! 🙏",
+        catalog.text(user_locale(update.effective_user), 'screenshot_received', order_id=order_id),
         parse_mode='Markdown',
         protect_content=True
     )
     
     # Forward to admin with approval buttons
     try:
-        if update.message.photo:
-            await context.bot.send_photo(
-                chat_id=ADMIN_CHAT_ID,
-                photo=update.message.photo[-1].file_id,
-                caption=f"💳 *PAYMENT SCREENSHOT*\n\n"
-                        f"📋 Order: `{order_id}`\n"
-                        f"👤 User: {order['first_name']} (@{username})\n"
-                        f"🆔 User ID: `{user_id}`\n"
-                        f"💰 Amount: ₹{order['amount']}\n"
-                        f"⏰ Time: {datetime.now().strftime('%d %b, %I:%M %p')}\n\n"
-                        f"*Verify payment and approve:*\n"
-                        f"`/approve {order_id}`\n\n"
-                        f"*Or reject:*\n"
-                        f"`/reject {order_id}`",
-                parse_mode='Markdown'
-            )
-        else:
-            await context.bot.send_message(
-                chat_id=ADMIN_CHAT_ID,
-                text=f"📸 *Screenshot Received* (but not a photo)\n\n"
-                     f"Order: `{order_id}`\n"
-                     f"User: {username} ({user_id})\n\n"
-                     f"Use: `/approve {order_id}`",
-                parse_mode='Markdown'
-            )
+        reviewer = reviewer_pool.assign(order_id)
+        save_reviewers()
+        await send_review_card(
+            context.bot,
+            reviewer or ADMIN_CHAT_ID,
+            order_id,
+            review_caption(order_id, "💳 *PAYMENT SCREENSHOT*"),
+            review_keyboard(order_id)
+        )
     except Exception as e:
         logger.error(f"Admin notification error: {e}")
 
 
-async def approve_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Admin approves order"""
-    user_id = update.effective_user.id
+# Approval steps, in order. Each state means "this step is done";
+# every step is safe to repeat, so an interrupted approval is resumed
+# by running run_approval again.
+APPROVAL_STATES = ('approving', 'link_created', 'approved', 'member_added', 'done')
+
+# Approval finished without reaching the user (blocked the bot)
+APPROVAL_NOTIFY_FAILED = 'notify_failed'
+
+# Orders with an approval running right now
+approvals_running = set()
+
+
+def approval_incomplete(order):
+    """True if an approval was started but not finished"""
+    return order.get('approval_state') in APPROVAL_STATES[:-1]
+
+
+def set_approval_state(order_id, state):
+    """Persist approval progress"""
+    orders_db[order_id]['approval_state'] = state
+    save_db(ORDERS_FILE, orders_db)
+
+
+async def run_approval(bot, order_id):
+    """Approve order: create link, mark approved, add member, send link.
     
-    # Check admin
-    if str(user_id) != ADMIN_CHAT_ID:
-        await update.message.reply_text("❌ Unauthorized!")
-        return
+    Resumes from the last persisted step. Returns the invite link, or
+    None if the link could not be created or the order is already being
+    approved.
+    """
+    if order_id in approvals_running:
+        return None
+    order = orders_db[order_id]
+    approvals_running.add(order_id)
+    try:
+        state = order.get('approval_state')
+        
+        if state not in APPROVAL_STATES:
+            set_approval_state(order_id, 'approving')
+            state = 'approving'
+        
+        # Step 1: invite link (reuse the one already made for this order)
+        if state == 'approving':
+            link_data = invite_links_db.get(str(order['user_id']), {})
+            if link_data.get('order_id') == order_id:
+                invite_link = link_data['link']
+            else:
+                invite_link = await create_single_use_invite_link(
+                    bot,
+                    order['user_id'],
+                    order['username'],
+                    order_id
+                )
+            
+            if not invite_link:
+                # Nothing done yet; leave it to the admin to retry
+                order.pop('approval_state', None)
+                save_db(ORDERS_FILE, orders_db)
+                return None
+            
+            orders_db[order_id]['invite_link'] = invite_link
+            set_approval_state(order_id, 'link_created')
+            state = 'link_created'
+        
+        invite_link = order['invite_link']
+        
+        # Step 2: mark approved
+        if state == 'link_created':
+            review_queue.pop(order_id, None)
+            reviewer_pool.release(order_id)
+            amount_tags.release(order_id)
+            orders_db[order_id]['status'] = 'approved'
+            orders_db[order_id]['approved_at'] = int(time.time())
+            set_approval_state(order_id, 'approved')
+            state = 'approved'
+        
+        # Step 3: add to members
+        if state == 'approved':
+            if members_db.get(str(order['user_id']), {}).get('order_id') != order_id:
+                add_member(order['user_id'], order['username'], order_id)
+            set_approval_state(order_id, 'member_added')
+            state = 'member_added'
+        
+        # Step 4: send link to user
+        if state == 'member_added':
+            state = await notify_approved(bot, order_id, invite_link)
+            set_approval_state(order_id, state)
+            if state == APPROVAL_NOTIFY_FAILED:
+                await alert_notify_failed(bot, order_id, invite_link)
+        
+        return invite_link
+    finally:
+        approvals_running.discard(order_id)
+
+
+async def notify_approved(bot, order_id, invite_link):
+    """Send invite link to user; returns the resulting approval state"""
+    order = orders_db[order_id]
+    
+    try:
+        locale = catalog.locale_for(order.get('language'))
+        success_message = catalog.text(
+            locale, 'approved',
+            first_name=order['first_name'], order_id=order_id,
+            amount=format_amount(order['amount']), invite_link=invite_link
+        )
+        
+        keyboard = InlineKeyboardMarkup([
+            [InlineKeyboardButton(catalog.text(locale, 'btn_join_channel'), url=invite_link)],
+        ])
+        
+        await bot.send_message(
+            chat_id=order['user_id'],
+            text=success_message,
+            reply_markup=keyboard,
+            parse_mode='Markdown',
+            protect_content=True
+        )
+    except Forbidden as e:
+        logger.error(f"User {order['user_id']} blocked the bot: {e}")
+        return APPROVAL_NOTIFY_FAILED
+    except Exception as e:
+        # Left at member_added so the recovery worker retries
+        logger.error(f"Error sending to user: {e}")
+        order['notify_attempts'] = order.get('notify_attempts', 0) + 1
+        if order['notify_attempts'] >= APPROVAL_MAX_NOTIFY_ATTEMPTS:
+            return APPROVAL_NOTIFY_FAILED
+        return 'member_added'
     
+    return 'done'
+
+
+async def alert_notify_failed(bot, order_id, invite_link):
+    """Tell the admin a paid user never got their link"""
+    order = orders_db[order_id]
+    try:
+        await bot.send_message(
+            chat_id=ADMIN_CHAT_ID,
+            text=f"⚠️ *Could Not Deliver Invite Link*\n\n"
+                 f"📋 Order: `{order_id}`\n"
+                 f"👤 User: {escape_markdown(order['first_name'])} (@{escape_markdown(order['username'])})\n"
+                 f"🆔 User ID: `{order['user_id']}`\n\n"
+                 f"Send them the link yourself:\n`{invite_link}`",
+            parse_mode='Markdown'
+        )
+    except Exception as e:
+        logger.error(f"Could not alert admin about {order_id}: {e}")
+
+
+async def resume_approvals(application):
+    """Finish approvals interrupted by a crash or Bot API failure"""
+    while True:
+        incomplete = [
+            order_id for order_id, order in orders_db.items()
+            if approval_incomplete(order) and order_id not in approvals_running
+        ]
+        
+        for order_id in incomplete:
+            # Finished by an approval started while we were busy
+            if not approval_incomplete(orders_db[order_id]):
+                continue
+            logger.info(f"🔁 Resuming approval of {order_id} ({orders_db[order_id]['approval_state']})")
+            try:
+                await run_approval(application.bot, order_id)
+            except Exception as e:
+                logger.error(f"Resume error for {order_id}: {e}")
+        
+        await asyncio.sleep(APPROVAL_RETRY_MINUTES * 60)
+
+
+async def approve_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin approves order"""
     # Get order ID
     if not context.args:
         await update.message.reply_text(
@@ -626,17 +863,16 @@ async def approve_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     order = orders_db[order_id]
     
-    if order['status'] == 'approved':
+    if order_id in approvals_running:
+        await update.message.reply_text(f"⏳ Order `{order_id}` is being approved...", parse_mode='Markdown')
+        return
+    
+    # Approved orders with an unfinished approval are resumed instead
+    if order['status'] == 'approved' and not approval_incomplete(order):
         await update.message.reply_text(f"✅ Order `{order_id}` already approved!", parse_mode='Markdown')
         return
     
-    # Create invite link
-    invite_link = await create_single_use_invite_link(
-        context,
-        order['user_id'],
-        order['username'],
-        order_id
-    )
+    invite_link = await run_approval(context.bot, order_id)
     
     if not invite_link:
         await update.message.reply_text(
@@ -650,160 +886,348 @@ async def approve_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    # Update order
-    orders_db[order_id]['status'] = 'approved'
-    orders_db[order_id]['approved_at'] = datetime.now().isoformat()
-    orders_db[order_id]['invite_link'] = invite_link
-    save_db(ORDERS_FILE, orders_db)
-    
-    # Add to members
-    add_member(order['user_id'], order['username'], order_id)
-    
-    # Send link to user
-    try:
-        success_message = f"""
-✅ *PAYMENT APPROVED - ACCESS GRANTED!* ✅
-
-🎉 Congratulations {order['first_name']}!
-
-📋 *Order ID:* `{order_id}`
-💰 *Amount:* ₹{order['amount']}
-✨ *Status:* Approved
-
-━━━━━━━━━━━━━━━━━━━━━━━━
-
-*🔗 YOUR EXCLUSIVE INVITE LINK:*
-
-{invite_link}
-
-━━━━━━━━━━━━━━━━━━━━━━━━
-
-*CLICK LINK TO JOIN CHANNEL NOW!*
-
-*🔒 IMPORTANT:*
-• Works ONLY ONCE
-• Valid for {INVITE_LINK_EXPIRY_HOURS} hours
-• Cannot be shared
-
-Welcome! 🚀
-"""
-        
-        keyboard = [
-            [InlineKeyboardButton("🔗 Join Premium Channel", url=invite_link)],
-        ]
-        
-        await context.bot.send_message(
-            chat_id=order['user_id'],
-            text=success_message,
-            reply_markup=InlineKeyboardMarkup(keyboard),
-            parse_mode='Markdown',
-            protect_content=True
-        )
-    except Exception as e:
-        logger.error(f"Error sending to user: {e}")
+    if order.get('approval_state') == 'done':
+        delivery = "Link sent to user!"
+    elif order.get('approval_state') == APPROVAL_NOTIFY_FAILED:
+        delivery = "⚠️ Could not message user - send them the link."
+    else:
+        delivery = f"⚠️ Could not message user - retrying every {APPROVAL_RETRY_MINUTES} min."
     
     # Confirm to admin
     await update.message.reply_text(
         f"✅ *Approved!*\n\n"
         f"Order: `{order_id}`\n"
         f"User: {order['first_name']} (@{order['username']})\n"
-        f"Link sent to user!\n\n"
+        f"{delivery}\n\n"
         f"Link: {invite_link}",
         parse_mode='Markdown'
     )
     
+    record_review(update.effective_user.id, order_id, 'approved')
     logger.info(f"✅ Order {order_id} approved by admin")
 
 
-async def reject_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Admin rejects order"""
-    user_id = update.effective_user.id
-    
-    if str(user_id) != ADMIN_CHAT_ID:
-        await update.message.reply_text("❌ Unauthorized!")
-        return
-    
-    if not context.args:
-        await update.message.reply_text("Usage: `/reject ORDER_ID`", parse_mode='Markdown')
-        return
-    
-    order_id = context.args[0]
-    
-    if order_id not in orders_db:
-        await update.message.reply_text(f"❌ Order `{order_id}` not found!", parse_mode='Markdown')
-        return
-    
+async def reject(bot, order_id):
+    """Mark order rejected and tell the user"""
     order = orders_db[order_id]
     
     # Update status
     orders_db[order_id]['status'] = 'rejected'
-    orders_db[order_id]['rejected_at'] = datetime.now().isoformat()
+    orders_db[order_id]['rejected_at'] = int(time.time())
     save_db(ORDERS_FILE, orders_db)
+    review_queue.pop(order_id, None)
+    reviewer_pool.release(order_id)
+    amount_tags.release(order_id)
     
     # Notify user
     try:
-        await context.bot.send_message(
+        await bot.send_message(
             chat_id=order['user_id'],
-            text=f"❌ *Payment Verification Failed*\n\n"
-                 f"Order: `{order_id}`\n\n"
-                 f"Your payment could not be verified.\n\n"
-                 f"Please contact admin: {ADMIN_USERNAME}",
+            text=catalog.text(catalog.locale_for(order.get('language')), 'rejected', order_id=order_id),
             parse_mode='Markdown'
         )
     except:
         pass
-    
-    await update.message.reply_text(
-        f"❌ Rejected!\n\nOrder: `{order_id}`\nUser notified.",
-        parse_mode='Markdown'
-    )
 
 
-async def pending_orders(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Show pending orders"""
-    user_id = update.effective_user.id
-    
-    if str(user_id) != ADMIN_CHAT_ID:
-        await update.message.reply_text("❌ Unauthorized!")
+async def reject_order(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin rejects order"""
+    if not context.args:
+        await update.message.reply_text("Usage: `/reject ORDER_ID`", parse_mode='Markdown')
         return
     
-    pending = [o for o in orders_db.items() if o[1]['status'] == 'pending']
+    order_id = context.args[0]
     
-    if not pending:
-        await update.message.reply_text("📭 No pending orders!")
+    if order_id not in orders_db:
+        await update.message.reply_text(f"❌ Order `{order_id}` not found!", parse_mode='Markdown')
         return
     
-    message = f"⏳ *PENDING ORDERS ({len(pending)})*\n\n"
-    
-    for order_id, order in pending[:10]:
-        screenshot = "✅" if order.get('screenshot_uploaded') else "❌"
-        message += (
-            f"📋 `{order_id}`\n"
-            f"👤 {order['first_name']} (@{order.get('username', 'N/A')})\n"
-            f"💰 ₹{order['amount']}\n"
-            f"📸 Screenshot: {screenshot}\n"
-            f"⏰ {order['created_at'][:16]}\n\n"
-            f"Approve: `/approve {order_id}`\n"
-            f"Reject: `/reject {order_id}`\n\n"
-        )
+    await reject(context.bot, order_id)
+    record_review(update.effective_user.id, order_id, 'rejected')
     
-    await update.message.reply_text(message, parse_mode='Markdown')
+    await update.message.reply_text(
+        f"❌ Rejected!\n\nOrder: `{order_id}`\nUser notified.",
+        parse_mode='Markdown'
+    )
 
 
-async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Show stats"""
-    user_id = update.effective_user.id
-    
-    if str(user_id) != ADMIN_CHAT_ID:
-        await update.message.reply_text("❌ Unauthorized!")
-        return
-    
-    total_orders = len(orders_db)
-    approved = sum(1 for o in orders_db.values() if o['status'] == 'approved')
+def record_review(reviewer, order_id, outcome):
+    """Credit a decision to the reviewer who made it"""
+    order = orders_db[order_id]
+    started = order.get('screenshot_time') or order['created_at']
+    reviewer_pool.record(reviewer, outcome, time.time() - started)
+    save_reviewers()
+
+
+def review_caption(order_id, title):
+    """Screenshot card text for admins"""
+    order = orders_db[order_id]
+    return (
+        f"{title}\n\n"
+        f"📋 Order: `{order_id}`\n"
+        f"👤 User: {escape_markdown(order['first_name'])} (@{escape_markdown(order['username'])})\n"
+        f"🆔 User ID: `{order['user_id']}`\n"
+        f"💰 Amount: ₹{format_amount(order['amount'])}\n"
+        f"⏰ Time: {format_time(order.get('screenshot_time'), '%d %b, %I:%M %p')}"
+    )
+
+
+def review_keyboard(order_id, card=False):
+    """Approve/Reject buttons; cards (/review) also get Skip"""
+    mode = ('card',) if card else ()
+    row = [
+        InlineKeyboardButton("✅ Approve", callback_data=encode('review', 'approve', order_id, *mode)),
+        InlineKeyboardButton("❌ Reject", callback_data=encode('review', 'reject', order_id, *mode)),
+    ]
+    if card:
+        row.append(InlineKeyboardButton("⏭️ Skip", callback_data=encode('review', 'skip', order_id, *mode)))
+    return InlineKeyboardMarkup([row])
+
+
+async def send_review_card(bot, chat_id, order_id, caption, keyboard):
+    """Send the order's screenshot with caption and buttons"""
+    order = orders_db[order_id]
+    if order.get('screenshot_type') == 'document':
+        return await bot.send_document(
+            chat_id=chat_id,
+            document=order['screenshot_file_id'],
+            caption=caption,
+            reply_markup=keyboard,
+            parse_mode='Markdown'
+        )
+    return await bot.send_photo(
+        chat_id=chat_id,
+        photo=order['screenshot_file_id'],
+        caption=caption,
+        reply_markup=keyboard,
+        parse_mode='Markdown'
+    )
+
+
+def next_review_card(reviewer):
+    """(order_id, caption) of the next screenshot for reviewer, or None.
+    
+    Skips orders leased to another reviewer; the one shown is claimed.
+    """
+    for order_id in review_queue:
+        if reviewer_pool.assignee(order_id) in (None, str(reviewer)):
+            reviewer_pool.claim(order_id, reviewer)
+            save_reviewers()
+            return order_id, review_caption(order_id, f"🧾 *REVIEW* ({len(review_queue)} left)")
+    return None
+
+
+async def review_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Walk pending screenshots one card at a time"""
+    card = next_review_card(update.effective_user.id)
+    if not card:
+        await update.message.reply_text("📭 Nothing to review!")
+        return
+    
+    order_id, caption = card
+    await send_review_card(context.bot, update.effective_chat.id, order_id, caption, review_keyboard(order_id, card=True))
+
+
+async def show_next_review_card(query):
+    """Replace the current /review card with the next one"""
+    card = next_review_card(query.from_user.id)
+    try:
+        if not card:
+            await query.edit_message_caption("🎉 Review queue empty!")
+            return
+        
+        order_id, caption = card
+        order = orders_db[order_id]
+        media_type = InputMediaDocument if order.get('screenshot_type') == 'document' else InputMediaPhoto
+        await query.edit_message_media(
+            media_type(order['screenshot_file_id'], caption=caption, parse_mode='Markdown'),
+            reply_markup=review_keyboard(order_id, card=True)
+        )
+    except Exception as e:
+        logger.error(f"Review card error: {e}")
+
+
+async def review_callback(query, context, action, order_id, mode=''):
+    """Approve/Reject/Skip buttons on screenshots and /review cards"""
+    order = orders_db.get(order_id)
+    
+    if action == 'skip':
+        if order_id in review_queue:
+            review_queue.move_to_end(order_id)
+            reviewer_pool.release(order_id)
+            save_reviewers()
+    elif order is None or order['status'] != 'pending' or order_id in approvals_running:
+        # Decided elsewhere (command, reconciliation, another tap)
+        review_queue.pop(order_id, None)
+        outcome = f"ℹ️ Already {order['status']}" if order else "❌ Order not found"
+    elif action == 'approve':
+        if not await run_approval(context.bot, order_id):
+            await context.bot.send_message(
+                chat_id=query.message.chat_id,
+                text=f"❌ *Error Creating Link!*\n\nOrder: `{order_id}`\n\nCheck the bot is admin in the channel.",
+                parse_mode='Markdown'
+            )
+            return
+        outcome = "✅ Approved"
+        record_review(query.from_user.id, order_id, 'approved')
+        logger.info(f"✅ Order {order_id} approved by admin (review)")
+    else:
+        await reject(context.bot, order_id)
+        outcome = "❌ Rejected"
+        record_review(query.from_user.id, order_id, 'rejected')
+        logger.info(f"❌ Order {order_id} rejected by admin (review)")
+    
+    if mode == 'card':
+        await show_next_review_card(query)
+        return
+    
+    # Forwarded screenshot: record the decision on it, drop the buttons
+    if action != 'skip':
+        caption = review_caption(order_id, f"💳 *PAYMENT SCREENSHOT* - {outcome}") if order else outcome
+        try:
+            await query.edit_message_caption(caption, parse_mode='Markdown')
+        except Exception as e:
+            logger.error(f"Edit error: {e}")
+
+
+async def expire_unpaid_orders(application):
+    """Expire tagged orders left unpaid; free their amount tags later.
+    
+    An expired order may still have been paid (no screenshot sent), so
+    its tag stays reserved, and /reconcile can still match it, until
+    RECONCILE_WINDOW_HOURS after it was created.
+    """
+    while True:
+        await asyncio.sleep(60)
+        
+        if not amount_tags:
+            continue
+        
+        now = time.time()
+        expire_cutoff = now - PAYMENT_EXPIRY_MINUTES * 60
+        release_cutoff = now - RECONCILE_WINDOW_HOURS * 3600
+        expired = 0
+        released = 0
+        
+        for order_id in list(amount_tags.by_order):
+            order = orders_db[order_id]
+            if (order['status'] == 'pending' and order_id not in approvals_running
+                    and not order.get('screenshot_uploaded') and order['created_at'] < expire_cutoff):
+                order['status'] = 'expired'
+                order['expired_at'] = int(now)
+                expired += 1
+            if order['status'] == 'expired' and order['created_at'] < release_cutoff:
+                amount_tags.release(order_id)
+                released += 1
+        
+        if expired:
+            save_db(ORDERS_FILE, orders_db)
+            logger.info(f"⌛ Expired {expired} unpaid orders")
+        if released:
+            logger.info(f"♻️ Freed {released} amount tags")
+
+
+async def review_lease_loop(application):
+    """Hand screenshots to another reviewer when a lease runs out"""
+    # Screenshots queued with no saved lease (older data): ask someone now
+    for order_id in [o for o in review_queue if o not in reviewer_pool.leases]:
+        reviewer = reviewer_pool.assign(order_id)
+        if reviewer is None:
+            break
+        try:
+            await send_review_card(
+                application.bot,
+                reviewer,
+                order_id,
+                review_caption(order_id, "💳 *PAYMENT SCREENSHOT*"),
+                review_keyboard(order_id)
+            )
+        except Exception as e:
+            logger.error(f"Review notification error: {e}")
+    save_reviewers()
+    
+    while True:
+        await asyncio.sleep(60)
+        
+        expired = reviewer_pool.expired()
+        if not expired:
+            continue
+        
+        for order_id, previous in expired:
+            # Nobody to hand it to, or decided meanwhile
+            if len(reviewer_pool.reviewers) < 2 or order_id not in review_queue:
+                reviewer_pool.release(order_id)
+                continue
+            
+            reviewer = reviewer_pool.reassign(order_id, previous)
+            logger.info(f"👮 Review of {order_id} reassigned from {previous} to {reviewer}")
+            try:
+                await send_review_card(
+                    application.bot,
+                    reviewer,
+                    order_id,
+                    review_caption(order_id, "💳 *PAYMENT SCREENSHOT* (reassigned)"),
+                    review_keyboard(order_id)
+                )
+            except Exception as e:
+                logger.error(f"Reassign notification error: {e}")
+        
+        save_reviewers()
+
+
+async def reviewers_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Per-reviewer workload and throughput"""
+    message = (
+        f"👮 *REVIEWERS*\n"
+        f"Assignment: {REVIEW_ASSIGNMENT.replace('_', ' ')} · Lease: {REVIEW_LEASE_MINUTES} min\n\n"
+    )
+    for reviewer, open_count, approved, rejected, expired, avg_minutes in reviewer_pool.summary():
+        role = " (main)" if reviewer == str(ADMIN_CHAT_ID) else ""
+        role += "" if reviewer in ADMIN_IDS else " (removed)"
+        message += (
+            f"`{reviewer}`{role}\n"
+            f"   📥 Open: {open_count} · ✅ {approved} · ❌ {rejected} · ⏰ Expired: {expired}\n"
+            f"   ⌛ Avg decision: {avg_minutes:.1f} min\n\n"
+        )
+    
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+async def pending_orders(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show pending orders"""
+    pending = [o for o in orders_db.items() if o[1]['status'] == 'pending']
+    
+    if not pending:
+        await update.message.reply_text("📭 No pending orders!")
+        return
+    
+    message = f"⏳ *PENDING ORDERS ({len(pending)})*\n\n"
+    
+    for order_id, order in pending[:10]:
+        screenshot = "✅" if order.get('screenshot_uploaded') else "❌"
+        message += (
+            f"📋 `{order_id}`\n"
+            f"👤 {order['first_name']} (@{order.get('username', 'N/A')})\n"
+            f"💰 ₹{format_amount(order['amount'])}\n"
+            f"📸 Screenshot: {screenshot}\n"
+            f"⏰ {format_time(order['created_at'])}\n\n"
+            f"Approve: `/approve {order_id}`\n"
+            f"Reject: `/reject {order_id}`\n\n"
+        )
+    
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show stats"""
+    total_orders = len(orders_db)
+    approved = sum(1 for o in orders_db.values() if o['status'] == 'approved')
     pending = sum(1 for o in orders_db.values() if o['status'] == 'pending')
     rejected = sum(1 for o in orders_db.values() if o['status'] == 'rejected')
+    expired = sum(1 for o in orders_db.values() if o['status'] == 'expired')
     total_members = len(members_db)
-    revenue = sum(o['amount'] for o in orders_db.values() if o['status'] == 'approved')
+    revenue = round(sum(o['amount'] for o in orders_db.values() if o['status'] == 'approved'), 2)
+    used_links = sum(1 for l in invite_links_db.values() if l.get('used'))
     
     stats_message = f"""
 📊 *BOT STATISTICS*
@@ -813,13 +1237,15 @@ async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
 ✅ Approved: {approved}
 ⏳ Pending: {pending}
 ❌ Rejected: {rejected}
+⌛ Expired: {expired}
 
 *Members:*
 👥 Total: {total_members}
-🔗 Active Links: {len(invite_links_db)}
+🔗 Links Used: {used_links}
+⏳ Links Not Used: {len(invite_links_db) - used_links}
 
 *Revenue:*
-💰 Total: ₹{revenue}
+💰 Total: ₹{format_amount(revenue)}
 
 *System:*
 🔧 Mode: Semi-Automatic
@@ -829,30 +1255,273 @@ async def admin_stats(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(stats_message, parse_mode='Markdown')
 
 
-async def contact_admin(query, context):
-    """Contact admin"""
-    message = f"""
-📞 *CONTACT ADMIN*
+def format_member_line(user_id):
+    """One line of a member listing"""
+    member = members_db.get(str(user_id), {})
+    status = "✅" if member.get('active', True) else "🚫"
+    return (
+        f"{status} `{user_id}` `@{member.get('username') or 'N/A'}` "
+        f"· {format_time(member.get('joined_at'), '%Y-%m-%d')}"
+    )
 
-Need help?
 
-👤 Admin: {ADMIN_USERNAME}
+def members_page(ids):
+    """Render a /members page with cursor buttons"""
+    message = f"👥 *MEMBERS ({len(member_index)})*\n\n"
+    message += "\n".join(format_member_line(user_id) for user_id in ids)
+    
+    buttons = []
+    if ids and member_index.has_before(ids[0]):
+        buttons.append(InlineKeyboardButton("◀️ Prev", callback_data=encode('members', 'prev', ids[0])))
+    if ids and member_index.has_after(ids[-1]):
+        buttons.append(InlineKeyboardButton("Next ▶️", callback_data=encode('members', 'next', ids[-1])))
+    
+    return message, InlineKeyboardMarkup([buttons]) if buttons else None
 
-Click below to message:
-"""
+
+async def list_members(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show members, one page at a time"""
+    ids = member_index.page_after(None, MEMBERS_PAGE_SIZE)
+    
+    if not ids:
+        await update.message.reply_text("📭 No members yet!")
+        return
+    
+    message, keyboard = members_page(ids)
+    await update.message.reply_text(message, reply_markup=keyboard, parse_mode='Markdown')
+
+
+async def members_page_callback(query, context, direction, cursor):
+    """Move /members listing to the next/previous page"""
+    if direction == 'next':
+        ids = member_index.page_after(cursor, MEMBERS_PAGE_SIZE)
+    else:
+        ids = member_index.page_before(cursor, MEMBERS_PAGE_SIZE)
+    
+    if not ids:
+        return
+    
+    message, keyboard = members_page(ids)
+    try:
+        await query.edit_message_text(message, reply_markup=keyboard, parse_mode='Markdown')
+    except Exception as e:
+        logger.error(f"Edit error: {e}")
+
+
+async def find_member(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Find members by username or user ID prefix"""
+    if not context.args:
+        await update.message.reply_text(
+            "Usage: `/find USERNAME_OR_ID`\n\n"
+            "Example: `/find rahul` or `/find 81873`",
+            parse_mode='Markdown'
+        )
+        return
+    
+    query = context.args[0]
+    ids = member_index.search(query, MEMBERS_PAGE_SIZE)
+    
+    if not ids:
+        await update.message.reply_text(f"🔍 No members matching `{query}`", parse_mode='Markdown')
+        return
+    
+    message = f"🔍 *Members matching* `{query}`\n\n"
+    for member_id in ids:
+        member = members_db.get(str(member_id), {})
+        message += format_member_line(member_id) + f"\n    📋 `{member.get('order_id', 'N/A')}`\n"
+    
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+async def reconcile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin starts statement reconciliation"""
+    context.user_data['awaiting_statement'] = True
+    
+    await update.message.reply_text(
+        "🧾 *RECONCILE PAYMENTS*\n\n"
+        "Send your exported bank/UPI statement as a *CSV file*.\n\n"
+        "Credits are matched to open orders by the "
+        "`Order ORD...` note, or by amount within "
+        f"{RECONCILE_WINDOW_HOURS}h of the order.",
+        parse_mode='Markdown'
+    )
+
+
+async def handle_statement(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle statement CSV upload"""
+    if not context.user_data.pop('awaiting_statement', False):
+        await update.message.reply_text("Send /reconcile first, then the statement CSV.")
+        return
+    
+    await update.message.reply_text("⏳ Reconciling statement...")
+    
+    # Index in the event loop (cheap), stream the CSV in a worker thread
+    index = reconcile.build_pending_index(orders_db)
+    
+    fd, path = tempfile.mkstemp(prefix='statement_', suffix='.csv')
+    os.close(fd)
+    try:
+        statement = await update.message.document.get_file()
+        await statement.download_to_drive(path)
+        result = await asyncio.to_thread(
+            reconcile.match_statement, path, index, RECONCILE_WINDOW_HOURS
+        )
+    except Exception as e:
+        logger.error(f"Reconcile error: {e}")
+        await update.message.reply_text(f"❌ Could not read statement: {e}")
+        return
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    logger.info(
+        f"🧾 Reconciled {result['credits']} credits: "
+        f"{len(result['matches'])} matched, {len(result['unmatched'])} unmatched"
+    )
+    
+    await update.message.reply_text(reconcile.format_summary(result))
+    
+    if not result['matches']:
+        return
+    
+    if RECONCILE_AUTO_APPLY:
+        await apply_reconciliation(context, update.effective_chat.id, result['matches'])
+        return
+    
+    context.user_data['reconcile_matches'] = result['matches']
     
     keyboard = [
-        [InlineKeyboardButton("💬 Message Admin", url=f"https://t.me/{ADMIN_USERNAME.replace('@', '')}")],
-        [InlineKeyboardButton("🔙 Back", callback_data='back_main')],
+        [InlineKeyboardButton(f"✅ Approve {len(result['matches'])} Matched", callback_data=encode('reconcile', 'apply'))],
+        [InlineKeyboardButton("🗑️ Discard", callback_data=encode('reconcile', 'discard'))],
     ]
     
+    await update.message.reply_text(
+        f"Approve *{len(result['matches'])}* matched orders and send invite links?",
+        reply_markup=InlineKeyboardMarkup(keyboard),
+        parse_mode='Markdown'
+    )
+
+
+async def apply_reconciliation(context, chat_id, matches):
+    """Approve reconciled orders in bulk"""
+    approved = 0
+    skipped = 0
+    failed = []
+    
+    for match in matches:
+        order_id = match['order_id']
+        order = orders_db.get(order_id)
+        
+        # Approved/rejected since the statement was matched
+        if not order or order['status'] not in reconcile.OPEN_STATUSES or order_id in approvals_running:
+            skipped += 1
+            continue
+        
+        orders_db[order_id]['payment_reference'] = match['reference'] or f"statement line {match['line']}"
+        
+        if await run_approval(context.bot, order_id):
+            approved += 1
+            logger.info(f"✅ Order {order_id} approved by reconciliation ({match['method']})")
+        else:
+            failed.append(order_id)
+    
+    message = (
+        f"🧾 *Reconciliation Applied*\n\n"
+        f"✅ Approved: {approved}\n"
+        f"⏭️ Skipped (already decided): {skipped}\n"
+        f"❌ Link errors: {len(failed)}"
+    )
+    if failed:
+        message += "\n\nRetry with /approve:\n" + "\n".join(f"`{o}`" for o in failed[:20])
+    
+    await context.bot.send_message(chat_id=chat_id, text=message, parse_mode='Markdown')
+
+
+async def reconcile_callback(query, context, action):
+    """Apply or discard proposed reconciliation"""
+    matches = context.user_data.pop('reconcile_matches', None)
+    
+    if action == 'discard' or not matches:
+        try:
+            await query.edit_message_text("🗑️ Reconciliation discarded.")
+        except Exception as e:
+            logger.error(f"Edit error: {e}")
+        return
+    
+    try:
+        await query.edit_message_text(f"⏳ Approving {len(matches)} orders...")
+    except Exception as e:
+        logger.error(f"Edit error: {e}")
+    
+    await apply_reconciliation(context, query.message.chat_id, matches)
+
+
+async def export_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin exports orders/members as a document"""
+    args = [a.lower() for a in context.args]
+    fmt = 'jsonl' if 'jsonl' in args else 'csv'
+    args = [a for a in args if a not in export.EXPORT_FORMATS]
+    
+    if not args or args[0] not in export.EXPORT_KINDS:
+        await update.message.reply_text(
+            "Usage: `/export orders|members [from] [to] [csv|jsonl]`\n\n"
+            "Example: `/export orders 2026-02-01 2026-02-28`",
+            parse_mode='Markdown'
+        )
+        return
+    
+    kind = args[0]
+    try:
+        start = export.parse_date_arg(args[1]) if len(args) > 1 else None
+        end = export.parse_date_arg(args[2], end_of_day=True) if len(args) > 2 else None
+    except ValueError:
+        await update.message.reply_text("❌ Dates must be YYYY-MM-DD")
+        return
+    
+    db = orders_db if kind == 'orders' else members_db
+    
+    # Snapshot keys so handlers can keep writing while the worker thread streams
+    try:
+        path, count = await asyncio.to_thread(
+            export.export_to_tempfile, db, kind, fmt, start, end, list(db)
+        )
+    except Exception as e:
+        logger.error(f"Export error: {e}")
+        await update.message.reply_text(f"❌ Export failed: {e}")
+        return
+    
+    try:
+        with open(path, 'rb') as f:
+            await context.bot.send_document(
+                chat_id=update.effective_chat.id,
+                document=f,
+                filename=f"{kind}_{datetime.now().strftime('%Y%m%d_%H%M')}.{fmt}",
+                caption=f"📤 {count} {kind}"
+            )
+    except Exception as e:
+        logger.error(f"Export send error: {e}")
+        await update.message.reply_text(f"❌ Could not send export: {e}")
+    finally:
+        os.remove(path)
+    
+    logger.info(f"📤 Exported {count} {kind} ({fmt})")
+
+
+async def contact_admin(query, context):
+    """Contact admin"""
+    locale = user_locale(query.from_user)
+    message = catalog.text(locale, 'contact')
+    keyboard = catalog.keyboard(locale, 'contact')
+    
     # Check if message has text (text message) or photo (photo message)
     if query.message.text:
         # It's a text message, can edit
         try:
             await query.edit_message_text(
                 message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown'
             )
         except Exception as e:
@@ -868,7 +1537,7 @@ Click below to message:
             await context.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown',
                 protect_content=True
             )
@@ -879,20 +1548,9 @@ Click below to message:
 async def back_to_main(query, context):
     """Back to main"""
     user = query.from_user
-    
-    message = f"""
-🎉 *Welcome back, {user.first_name}!*
-
-Get Lifetime Access for ₹{MEMBERSHIP_PRICE}! 🚀
-
-Ready to join? 👇
-"""
-    
-    keyboard = [
-        [InlineKeyboardButton("🚀 Join Membership", callback_data='join_membership')],
-        [InlineKeyboardButton("ℹ️ How It Works", callback_data='how_it_works')],
-        [InlineKeyboardButton("📞 Contact Admin", callback_data='contact_admin')],
-    ]
+    locale = user_locale(user)
+    message = catalog.text(locale, 'welcome_back', first_name=user.first_name)
+    keyboard = catalog.keyboard(locale, 'main')
     
     # Check if message has text (text message) or photo (photo message)
     if query.message.text:
@@ -900,7 +1558,7 @@ Ready to join? 👇
         try:
             await query.edit_message_text(
                 message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown'
             )
         except Exception as e:
@@ -916,7 +1574,7 @@ Ready to join? 👇
             await context.bot.send_message(
                 chat_id=chat_id,
                 text=message,
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode='Markdown',
                 protect_content=True
             )
@@ -924,50 +1582,511 @@ Ready to join? 👇
             logger.error(f"Send error: {e}")
 
 
+async def track_chat_member(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Track joins/leaves in the premium channel"""
+    change = update.chat_member
+    
+    if change.chat.id != PREMIUM_CHANNEL_ID:
+        return
+    
+    was_in = change.old_chat_member.status in (ChatMember.MEMBER, ChatMember.ADMINISTRATOR, ChatMember.OWNER)
+    is_in = change.new_chat_member.status in (ChatMember.MEMBER, ChatMember.ADMINISTRATOR, ChatMember.OWNER)
+    user = change.new_chat_member.user
+    
+    if was_in and not is_in:
+        if is_member(user.id):
+            mark_member_left(str(user.id), change.new_chat_member.status)
+            save_db(MEMBERS_FILE, members_db)
+            save_db(AUDIT_FILE, audit_state)
+        return
+    
+    if was_in or not is_in:
+        return
+    
+    key = find_invite_link_record(change.invite_link) if change.invite_link else None
+    
+    if key:
+        link_data = invite_links_db[key]
+        link_data['used'] = True
+        link_data['joined_at'] = change.date.isoformat()
+        link_data['joined_user_id'] = user.id
+        save_db(INVITE_LINKS_FILE, invite_links_db)
+        
+        if str(user.id) != key:
+            logger.warning(f"⚠️ Link for user {key} (order {link_data.get('order_id')}) used by {user.id}")
+        else:
+            logger.info(f"🔗 User {key} joined channel")
+    
+    if is_member(user.id):
+        mark_member_present(str(user.id))
+        save_db(MEMBERS_FILE, members_db)
+        save_db(AUDIT_FILE, audit_state)
+    elif not is_admin(user.id):
+        audit_state['unauthorized'][str(user.id)] = {
+            'username': user.username or user.first_name,
+            'joined_at': change.date.isoformat(),
+            'link': change.invite_link.name if change.invite_link else None,
+        }
+        save_db(AUDIT_FILE, audit_state)
+        logger.warning(f"🚨 Non-member {user.id} joined channel")
+
+
+def mark_member_left(user_id, status):
+    """Record a member who is no longer in the channel"""
+    member = members_db[user_id]
+    if not member.get('active', True):
+        return
+    member['active'] = False
+    member['left_at'] = int(time.time())
+    audit_state['leavers'][user_id] = {
+        'status': status,
+        'detected_at': to_iso(member['left_at']),
+    }
+    logger.info(f"👋 Member {user_id} left channel ({status})")
+
+
+def mark_member_present(user_id):
+    """Record a member seen in the channel"""
+    member = members_db[user_id]
+    if member.get('active', True):
+        return
+    member['active'] = True
+    member.pop('left_at', None)
+    audit_state['leavers'].pop(user_id, None)
+
+
+def on_audit_status(user_id, status):
+    """Apply one audit result to members_db"""
+    user_id = str(user_id)
+    if user_id not in members_db:
+        return
+    
+    if status not in membership_audit.OUT_STATUSES:
+        mark_member_present(user_id)
+        return
+    
+    # Approved but hasn't used the (still valid) invite link yet
+    link_data = invite_links_db.get(user_id, {})
+    if not link_data.get('used') and link_data.get('expires_at', '') > datetime.now().isoformat():
+        return
+    
+    mark_member_left(user_id, status if link_data.get('used', True) else 'never_joined')
+
+
+def save_audit_state():
+    """Persist audit checkpoint and member changes"""
+    save_db(AUDIT_FILE, audit_state)
+    save_db(MEMBERS_FILE, members_db)
+
+
+async def membership_audit_loop(application):
+    """Run a membership audit every AUDIT_INTERVAL_HOURS"""
+    if AUDIT_INTERVAL_HOURS <= 0:
+        return
+    
+    # Let startup traffic settle first
+    await asyncio.sleep(60)
+    
+    while True:
+        if audit_state.get('cursor') is None:
+            last = audit_state.get('last_finished_at') or 0
+            wait = last + AUDIT_INTERVAL_HOURS * 3600 - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        
+        try:
+            await membership_audit.run_audit_pass(
+                application.bot,
+                PREMIUM_CHANNEL_ID,
+                member_index.page_after,
+                on_audit_status,
+                audit_state,
+                save_audit_state,
+                batch_size=AUDIT_BATCH_SIZE,
+                concurrency=AUDIT_CONCURRENCY,
+                batch_delay=AUDIT_BATCH_DELAY_SECONDS
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Audit error: {e}")
+            await asyncio.sleep(300)
+
+
+async def audit_report(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show membership audit results"""
+    if audit_state.get('cursor') is not None:
+        progress = f"🔄 In progress: {audit_state['checked']}/{len(member_index)} checked"
+    elif audit_state.get('last_finished_at'):
+        finished = datetime.fromtimestamp(audit_state['last_finished_at']).strftime('%d %b, %I:%M %p')
+        progress = f"✅ Last run: {finished} ({audit_state['checked']} checked)"
+    else:
+        progress = "⏳ No audit completed yet"
+    
+    message = (
+        f"🔎 *MEMBERSHIP AUDIT*\n\n"
+        f"{progress}\n\n"
+        f"👋 Left / never joined: {len(audit_state['leavers'])}\n"
+        f"🚨 Joined without membership: {len(audit_state['unauthorized'])}\n"
+    )
+    
+    recent = list(audit_state['unauthorized'].items())[-10:]
+    if recent:
+        message += "\n*Recent unauthorized joins:*\n"
+        for uid, info in recent:
+            message += f"• `{uid}` `{info.get('username')}` {str(info.get('joined_at', ''))[:16]}\n"
+    
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+def save_broadcast_job():
+    save_db(BROADCAST_FILE, broadcast_job)
+
+
+def broadcast_recipient(user_id):
+    """Members a broadcast goes to: still in the channel, bot not blocked"""
+    member = members_db.get(str(user_id))
+    return member is not None and member.get('active', True) and not member.get('blocked')
+
+
+def mark_member_blocked(user_id):
+    member = members_db.get(str(user_id))
+    if member is not None:
+        member['blocked'] = True
+
+
+async def run_broadcast_job(application):
+    """Send (or resume) the current broadcast, then report to admin"""
+    try:
+        await broadcast.run_broadcast(
+            application.bot,
+            broadcast_job,
+            member_index.page_after,
+            broadcast_recipient,
+            mark_member_blocked,
+            save_broadcast_job,
+            batch_size=BROADCAST_BATCH_SIZE,
+            concurrency=BROADCAST_CONCURRENCY,
+            rate=BROADCAST_RATE_PER_SECOND
+        )
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"Broadcast error: {e}")
+        return
+    finally:
+        # Blocked flags, collected during the run
+        save_db(MEMBERS_FILE, members_db)
+    
+    try:
+        await application.bot.send_message(
+            chat_id=ADMIN_CHAT_ID,
+            text=format_broadcast_status(),
+            parse_mode='Markdown'
+        )
+    except Exception as e:
+        logger.error(f"Could not notify admin: {e}")
+
+
+def start_broadcast_task(application):
+    application.bot_data['broadcast_task'] = asyncio.create_task(run_broadcast_job(application))
+
+
+def format_broadcast_status():
+    job = broadcast_job
+    status = {
+        broadcast.RUNNING: "🔄 Sending",
+        broadcast.DONE: "✅ Finished",
+        broadcast.CANCELLED: "🛑 Cancelled",
+    }.get(job['status'], job['status'])
+    return (
+        f"📣 *BROADCAST*\n\n"
+        f"{status}\n"
+        f"📤 Progress: {job['attempted']}/{job['total']}\n"
+        f"✅ Sent: {job['sent']}\n"
+        f"🚫 Blocked bot: {job['blocked']}\n"
+        f"❌ Failed: {job['failed']}\n"
+        f"⏰ Started: {format_time(job['started_at'], '%d %b, %I:%M %p')}"
+    )
+
+
+async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Announce to all members"""
+    # "/broadcast Status update: ..." is an announcement, not a subcommand
+    subcommand = context.args[0].lower() if len(context.args) == 1 else ''
+    running = broadcast_job.get('status') == broadcast.RUNNING
+    task = context.application.bot_data.get('broadcast_task')
+    
+    if subcommand == 'status':
+        if not broadcast_job:
+            await update.message.reply_text("📭 No broadcast yet!")
+            return
+        await update.message.reply_text(format_broadcast_status(), parse_mode='Markdown')
+        return
+    
+    if subcommand == 'cancel':
+        if not running:
+            await update.message.reply_text("📭 No broadcast running!")
+            return
+        broadcast_job['status'] = broadcast.CANCELLED
+        save_broadcast_job()
+        await update.message.reply_text("🛑 Broadcast cancelled (the current batch finishes first).")
+        return
+    
+    if running:
+        await update.message.reply_text(
+            "⏳ A broadcast is already running.\n\n`/broadcast status` or `/broadcast cancel`",
+            parse_mode='Markdown'
+        )
+        return
+    
+    # Cancelled, but its last batch is still going out: the job dict is shared
+    if task and not task.done():
+        await update.message.reply_text("⏳ The cancelled broadcast is finishing its last batch, try again shortly.")
+        return
+    
+    reply_to = update.message.reply_to_message
+    parts = update.message.text.split(None, 1)
+    text = parts[1].strip() if len(parts) > 1 else ''
+    
+    if not reply_to and not text:
+        await update.message.reply_text(
+            "*Usage:*\n"
+            "`/broadcast your message` - send text\n"
+            "Reply to any message with `/broadcast` - send a copy of it\n"
+            "`/broadcast status` - progress\n"
+            "`/broadcast cancel` - stop",
+            parse_mode='Markdown'
+        )
+        return
+    
+    total = sum(1 for user_id in members_db if broadcast_recipient(user_id))
+    if reply_to:
+        job = broadcast.new_job(from_chat_id=update.effective_chat.id, message_id=reply_to.message_id, total=total)
+    else:
+        job = broadcast.new_job(text=text, total=total)
+    
+    broadcast_job.clear()
+    broadcast_job.update(job)
+    save_broadcast_job()
+    start_broadcast_task(context.application)
+    
+    logger.info(f"📣 Broadcast started to {total} members")
+    await update.message.reply_text(f"📣 Broadcast started to {total} members.\n\nI'll message you when it's done.")
+
+
+async def post_init(application):
+    """Start background jobs"""
+    try:
+        info = await application.bot.get_webhook_info()
+        application.update_processor.set_backlog(info.pending_update_count)
+    except Exception as e:
+        logger.error(f"Could not read pending update count: {e}")
+    
+    application.bot_data['audit_task'] = asyncio.create_task(membership_audit_loop(application))
+    application.bot_data['approval_task'] = asyncio.create_task(resume_approvals(application))
+    
+    application.bot_data['watchdog_task'] = asyncio.create_task(loop_watchdog.run())
+    application.bot_data['review_task'] = asyncio.create_task(review_lease_loop(application))
+    application.bot_data['expiry_task'] = asyncio.create_task(expire_unpaid_orders(application))
+    shared.on_reload_signal(on_reload_signal)
+    
+    if broadcast_job.get('status') == broadcast.RUNNING:
+        start_broadcast_task(application)
+
+
+async def post_shutdown(application):
+    """Stop background jobs"""
+    for name in ('audit_task', 'approval_task', 'broadcast_task', 'watchdog_task', 'review_task', 'expiry_task', 'profile_task'):
+        task = application.bot_data.get(name)
+        if task:
+            task.cancel()
+
+
 async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE):
     """Log errors"""
     logger.error(f"Error: {context.error}")
 
 
-def validate_config():
-    """Validate config"""
-    errors = []
+# Per-route metrics, shown by /metrics
+route_metrics = Metrics()
+
+# Event loop lag monitor (started in post_init)
+loop_watchdog = loop_monitor.LoopWatchdog(
+    threshold=LOOP_LAG_THRESHOLD_MS / 1000,
+    active=route_metrics.active
+)
+
+
+async def show_metrics(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show per-route call counts and latency"""
+    rows = route_metrics.summary()
     
+    if not rows:
+        await update.message.reply_text("📭 No requests yet!")
+        return
+    
+    message = "⏱️ *HANDLER METRICS*\n\n`route            calls err  avg ms  max ms`\n"
+    for name, calls, errors, avg_ms, max_ms in rows[:25]:
+        message += f"`{name[:16]:<16} {calls:>5} {errors:>3} {avg_ms:>7.1f} {max_ms:>7.1f}`\n"
+    
+    processor = context.application.update_processor
+    message += f"\n📥 Queued: {processor.queued} · Dropped: {processor.shed}"
+    message += f"\n🐌 Loop lag: max {loop_watchdog.max_lag * 1000:.0f} ms · Stalls: {loop_watchdog.stalls}"
+    
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+async def profile_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Sample the bot for N seconds and send folded stacks"""
     try:
-        _ = TELEGRAM_BOT_TOKEN
-        if 'YOUR_BOT_TOKEN' in TELEGRAM_BOT_TOKEN or len(TELEGRAM_BOT_TOKEN) < 10:
-            errors.append("❌ TELEGRAM_BOT_TOKEN invalid")
-    except NameError:
-        errors.append("❌ TELEGRAM_BOT_TOKEN not found")
+        seconds = int(context.args[0]) if context.args else 10
+    except ValueError:
+        await update.message.reply_text("Usage: `/profile SECONDS`", parse_mode='Markdown')
+        return
+    seconds = max(1, min(seconds, PROFILE_MAX_SECONDS))
+    
+    task = context.application.bot_data.get('profile_task')
+    if task and not task.done():
+        await update.message.reply_text("⏳ A profile is already running!")
+        return
     
+    # Runs in the background: this admin's later updates aren't held up
+    context.application.bot_data['profile_task'] = asyncio.create_task(
+        send_profile(context.bot, update.effective_chat.id, seconds)
+    )
+    
+    await update.message.reply_text(f"🔬 Profiling for {seconds}s...")
+
+
+async def send_profile(bot, chat_id, seconds):
+    """Sample the bot for seconds, then send the folded stacks to chat_id"""
     try:
-        _ = ADMIN_CHAT_ID
-    except NameError:
+        # Sampler runs in a worker thread so the loop keeps serving updates
+        folded, samples = await asyncio.to_thread(loop_monitor.profile, seconds)
+        
+        await bot.send_document(
+            chat_id=chat_id,
+            document=io.BytesIO(folded.encode('utf-8')),
+            filename=f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.folded",
+            caption=f"🔬 {samples} samples over {seconds}s\n"
+                    f"Open in speedscope.app or run flamegraph.pl on it"
+        )
+    except Exception as e:
+        logger.error(f"Profile error: {e}")
+        return
+    
+    logger.info(f"🔬 Profile sent ({seconds}s, {samples} samples)")
+
+
+def update_priority(update):
+    """Intake priority: admin, screenshots and payment taps first, other taps last"""
+    if not isinstance(update, Update):
+        return intake.PRIORITY_NORMAL
+    user = update.effective_user
+    if user and is_admin(user.id):
+        return intake.PRIORITY_ADMIN
+    if update.message and (update.message.photo or update.message.document):
+        return intake.PRIORITY_SCREENSHOT
+    if update.callback_query:
+        # Payment steps ("Get Access", "I Have Paid") are never dropped
+        code = decode(update.callback_query.data or '')[0]
+        if code in ('access', 'paid', 'get_access') or code.startswith('confirm_payment_'):
+            return intake.PRIORITY_SCREENSHOT
+        return intake.PRIORITY_BUTTON
+    return intake.PRIORITY_NORMAL
+
+
+def build_router():
+    """Routing table for all handlers"""
+    router = Router()
+    
+    # Middleware (outermost first)
+    router.use(capture_errors)
+    router.use(timing(route_metrics))
+    router.use(admin_only(is_admin))
+    router.use(throttle(TokenBucketLimiter(THROTTLE_RULES)))
+    
+    # User buttons (legacy= keeps buttons sent before the router working)
+    router.callback('join', show_membership_plan, legacy='join_membership')
+    router.callback('access', initiate_payment, throttle='access', legacy='get_access')
+    router.callback('paid', request_screenshot, throttle='paid', legacy='confirm_payment_')
+    router.callback('contact', contact_admin, legacy='contact_admin')
+    router.callback('help', show_how_it_works, legacy='how_it_works')
+    router.callback('main', back_to_main, legacy='back_main')
+    
+    # Admin buttons
+    router.callback('members', members_page_callback, admin=True)
+    router.callback('reconcile', reconcile_callback, admin=True)
+    router.callback('review', review_callback, admin=True)
+    
+    # User commands/messages
+    router.command('start', start)
+    router.message('screenshot', filters.PHOTO | filters.Document.IMAGE, handle_screenshot, throttle='screenshot')
+    router.chat_member('chat_member', track_chat_member)
+    
+    # Admin commands
+    router.command('approve', approve_order, admin=True)
+    router.command('reject', reject_order, admin=True)
+    router.command('pending', pending_orders, admin=True)
+    router.command('review', review_command, admin=True)
+    router.command('reviewers', reviewers_command, admin=True)
+    router.command('stats', admin_stats, admin=True)
+    router.command('members', list_members, admin=True)
+    router.command('find', find_member, admin=True)
+    router.command('audit', audit_report, admin=True)
+    router.command('reconcile', reconcile_command, admin=True)
+    router.command('export', export_command, admin=True)
+    router.command('metrics', show_metrics, admin=True)
+    router.command('broadcast', broadcast_command, admin=True)
+    router.command('profile', profile_command, admin=True)
+    router.command('reload', reload_command, admin=True)
+    router.message('statement', filters.Document.FileExtension("csv"), handle_statement, admin=True)
+    
+    return router
+
+
+def config_errors(settings):
+    """Problems in a config namespace (empty list = valid)"""
+    errors = []
+    
+    token = settings.get('TELEGRAM_BOT_TOKEN')
+    if token is None:
+        errors.append("❌ TELEGRAM_BOT_TOKEN not found")
+    elif 'YOUR_BOT_TOKEN' in token or len(token) < 10:
+        errors.append("❌ TELEGRAM_BOT_TOKEN invalid")
+    
+    if settings.get('ADMIN_CHAT_ID') is None:
         errors.append("❌ ADMIN_CHAT_ID not found")
     
-    try:
-        _ = UPI_ID
-        if 'your-upi-id' in UPI_ID.lower() or '@' not in UPI_ID:
-            errors.append("❌ UPI_ID invalid")
-    except NameError:
+    if not isinstance(settings.get('ADMIN_CHAT_IDS', []), (list, tuple, set)):
+        errors.append("❌ ADMIN_CHAT_IDS must be a list")
+    
+    if settings.get('REVIEW_ASSIGNMENT', STRATEGIES[0]) not in STRATEGIES:
+        errors.append(f"❌ REVIEW_ASSIGNMENT must be one of: {', '.join(STRATEGIES)}")
+    
+    upi_id = settings.get('UPI_ID')
+    if upi_id is None:
         errors.append("❌ UPI_ID not found")
+    elif 'your-upi-id' in upi_id.lower() or '@' not in upi_id:
+        errors.append("❌ UPI_ID invalid")
     
-    try:
-        _ = PREMIUM_CHANNEL_ID
-        if PREMIUM_CHANNEL_ID >= 0:
-            errors.append("❌ PREMIUM_CHANNEL_ID must be negative")
-    except NameError:
+    channel_id = settings.get('PREMIUM_CHANNEL_ID')
+    if channel_id is None:
         errors.append("❌ PREMIUM_CHANNEL_ID not found")
+    elif channel_id >= 0:
+        errors.append("❌ PREMIUM_CHANNEL_ID must be negative")
     
-    try:
-        _ = BOT_NAME
-    except NameError:
-        globals()['BOT_NAME'] = "Premium Membership Bot"
+    price = settings.get('MEMBERSHIP_PRICE')
+    if not isinstance(price, (int, float)) or price <= 0:
+        errors.append("❌ MEMBERSHIP_PRICE must be a positive number")
     
-    try:
-        _ = ADMIN_USERNAME
-    except NameError:
-        globals()['ADMIN_USERNAME'] = "@admin"
+    return errors
+
+
+def validate_config():
+    """Validate config"""
+    errors = config_errors(globals())
     
     if errors:
         print("\n" + "="*70)
@@ -981,6 +2100,115 @@ def validate_config():
     return True
 
 
+# Settings only read at startup; a reload reports them as needing a restart
+RESTART_ONLY_SETTINGS = frozenset((
+    'TELEGRAM_BOT_TOKEN', 'DATA_DIR', 'BOTS', 'THROTTLE_RULES',
+    'INTAKE_WORKERS', 'INTAKE_MAX_QUEUED', 'STALE_CALLBACK_MINUTES',
+))
+
+CONFIG_FILE = getattr(sys.modules.get('config'), '__file__', None) or 'config.py'
+
+_UNSET = object()
+
+
+def load_settings():
+    """Fresh settings from config.py, with per-bot overrides and defaults"""
+    namespace = runpy.run_path(CONFIG_FILE)
+    settings = {name: value for name, value in namespace.items() if name.isupper()}
+    settings.update(globals().get('BOT_OVERRIDES', {}))
+    for name, value in CONFIG_DEFAULTS.items():
+        settings.setdefault(name, value)
+    return settings
+
+
+def reload_config():
+    """Re-read config.py and switch to it.
+    
+    Returns (applied, needs_restart, errors); nothing changes on errors.
+    Orders keep the amount they were created with.
+    """
+    try:
+        settings = load_settings()
+        errors = config_errors(settings)
+        new_catalog = None if errors else compile_catalog(settings)
+    except Exception as e:
+        return [], [], [f"❌ config.py: {e}"]
+    if errors:
+        return [], [], errors
+    
+    changed = sorted(name for name, value in settings.items() if globals().get(name, _UNSET) != value)
+    applied = [name for name in changed if name not in RESTART_ONLY_SETTINGS]
+    needs_restart = [name for name in changed if name in RESTART_ONLY_SETTINGS]
+    
+    reviewers = admin_ids(settings)
+    
+    # One synchronous step: no handler can run halfway through the swap
+    globals().update({name: settings[name] for name in applied})
+    globals()['catalog'] = new_catalog
+    globals()['ADMIN_IDS'] = frozenset(reviewers)
+    reviewer_pool.set_reviewers(reviewers)
+    reviewer_pool.strategy = REVIEW_ASSIGNMENT
+    reviewer_pool.lease_seconds = REVIEW_LEASE_MINUTES * 60
+    loop_watchdog.threshold = LOOP_LAG_THRESHOLD_MS / 1000
+    
+    return applied, needs_restart, []
+
+
+def on_reload_signal():
+    """SIGHUP: reload config.py"""
+    applied, needs_restart, errors = reload_config()
+    if errors:
+        logger.error(f"🔄 Config reload rejected: {'; '.join(errors)}")
+        return
+    logger.info(f"🔄 Config reloaded: {', '.join(applied) or 'no changes'}")
+    if needs_restart:
+        logger.warning(f"🔄 Restart needed for: {', '.join(needs_restart)}")
+
+
+async def reload_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin reloads config.py"""
+    applied, needs_restart, errors = reload_config()
+    
+    if errors:
+        await update.message.reply_text(
+            "🚫 *Config not reloaded*\n\n" + "\n".join(escape_markdown(error) for error in errors),
+            parse_mode='Markdown'
+        )
+        return
+    
+    message = "🔄 *CONFIG RELOADED*\n\n"
+    message += f"✅ Applied: {', '.join(f'`{name}`' for name in applied) or 'no changes'}\n"
+    if needs_restart:
+        message += f"⚠️ Needs restart: {', '.join(f'`{name}`' for name in needs_restart)}\n"
+    message += "\nOpen orders keep the price they were created with."
+    
+    logger.info(f"🔄 Config reloaded by admin: {', '.join(applied) or 'no changes'}")
+    await update.message.reply_text(message, parse_mode='Markdown')
+
+
+def build_application():
+    """Application with all handlers and background jobs wired up"""
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .concurrent_updates(intake.PriorityUpdateProcessor(
+            update_priority,
+            workers=INTAKE_WORKERS,
+            max_queued=INTAKE_MAX_QUEUED,
+            stale_seconds=STALE_CALLBACK_MINUTES * 60
+        ))
+        .build()
+    )
+    
+    build_router().install(application)
+    
+    application.add_error_handler(error_handler)
+    
+    return application
+
+
 def main():
     """Start bot"""
     
@@ -1003,26 +2231,13 @@ def main():
     print("   ✅ Fraud prevention")
     print("="*70 + "\n")
     
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-    
-    # User handlers
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CallbackQueryHandler(button_callback))
-    application.add_handler(MessageHandler(filters.PHOTO | filters.Document.IMAGE, handle_screenshot))
-    
-    # Admin commands
-    application.add_handler(CommandHandler("approve", approve_order))
-    application.add_handler(CommandHandler("reject", reject_order))
-    application.add_handler(CommandHandler("pending", pending_orders))
-    application.add_handler(CommandHandler("stats", admin_stats))
-    
-    application.add_error_handler(error_handler)
+    application = build_application()
     
     logger.info("✅ Semi-Auto Bot Started!")
     logger.info(f"💰 Price: ₹{MEMBERSHIP_PRICE}")
     logger.info(f"🔒 Mode: Manual Approval")
     
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,141 @@
+"""
+MEMBER BROADCAST
+================
+Sends one announcement to every member, resumably.
+
+- Global send-rate cap shared by all workers, plus bounded concurrency
+- RetryAfter (flood control) pauses every worker, then retries
+- Users who blocked the bot are reported so they can be skipped later
+- At most once: each batch is checkpointed as attempted *before* it is
+  sent, so a restart continues after the last checkpoint and never
+  messages anyone twice (a crash mid-batch skips the rest of that
+  batch rather than repeating it)
+"""
+
+import asyncio
+import logging
+import time
+
+from telegram.error import Forbidden, RetryAfter, TelegramError
+
+from membership_audit import FloodGate
+
+logger = logging.getLogger(__name__)
+
+# Retries per recipient after flood control
+MAX_RETRIES = 3
+
+# Job statuses
+RUNNING = 'running'
+DONE = 'done'
+CANCELLED = 'cancelled'
+
+
+def new_job(text=None, from_chat_id=None, message_id=None, total=0):
+    """Broadcast job (persisted as data/broadcast.json).
+
+    Either text is sent, or message_id is copied from from_chat_id.
+    """
+    return {
+        'status': RUNNING,
+        'text': text,
+        'from_chat_id': from_chat_id,
+        'message_id': message_id,
+        'cursor': None,
+        'total': total,
+        'attempted': 0,
+        'sent': 0,
+        'blocked': 0,
+        'failed': 0,
+        'started_at': time.time(),
+        'finished_at': None,
+    }
+
+
+class SendPacer:
+    """Spaces sends evenly so the overall rate stays under rate/second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_at = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        slot = max(now, self.next_at)
+        self.next_at = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def send_one(bot, job, user_id, semaphore, pacer, gate):
+    """Deliver to one user: 'sent', 'blocked' or 'failed'"""
+    async with semaphore:
+        for _ in range(MAX_RETRIES):
+            await gate.wait()
+            await pacer.wait()
+            try:
+                if job.get('message_id'):
+                    await bot.copy_message(
+                        chat_id=int(user_id),
+                        from_chat_id=job['from_chat_id'],
+                        message_id=job['message_id']
+                    )
+                else:
+                    await bot.send_message(chat_id=int(user_id), text=job['text'])
+                return 'sent'
+            except RetryAfter as e:
+                logger.warning(f"⏳ Broadcast rate limited, pausing {e.retry_after}s")
+                gate.pause(e.retry_after)
+            except Forbidden:
+                return 'blocked'
+            except TelegramError as e:
+                logger.error(f"Broadcast error for {user_id}: {e}")
+                return 'failed'
+    return 'failed'
+
+
+async def run_broadcast(bot, job, page_after, should_send, on_blocked, save_job,
+                        batch_size=100, concurrency=10, rate=20):
+    """Run (or resume) a broadcast job until done or cancelled.
+
+    page_after(cursor, size) returns the next user IDs after cursor;
+    should_send(user_id) filters recipients (active, not blocked);
+    on_blocked(user_id) is called for users who blocked the bot;
+    save_job() persists job after every checkpoint.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    pacer = SendPacer(rate)
+    gate = FloodGate()
+
+    if job.get('cursor') is not None:
+        logger.info(f"📣 Resuming broadcast after user {job['cursor']}")
+
+    while job['status'] == RUNNING:
+        batch = page_after(job.get('cursor'), batch_size)
+        if not batch:
+            job['status'] = DONE
+            break
+
+        recipients = [user_id for user_id in batch if should_send(user_id)]
+
+        # Checkpoint before sending: a restart never repeats this batch
+        job['cursor'] = batch[-1]
+        job['attempted'] += len(recipients)
+        save_job()
+
+        results = await asyncio.gather(*(
+            send_one(bot, job, user_id, semaphore, pacer, gate) for user_id in recipients
+        ))
+        for user_id, result in zip(recipients, results):
+            job[result] += 1
+            if result == 'blocked':
+                on_blocked(user_id)
+        save_job()
+
+    job['finished_at'] = time.time()
+    save_job()
+    logger.info(
+        f"📣 Broadcast {job['status']}: {job['sent']} sent, "
+        f"{job['blocked']} blocked, {job['failed']} failed"
+    )
+    return job
@@ -38,8 +38,9 @@ UPI_ID = "aniruddha12@fam"
 # Merchant/Business name
 MERCHANT_NAME = "Premium Membership"
 
-# Payment window expiry (minutes)
-PAYMENT_EXPIRY_MINUTES = 10
+# Payment window expiry (minutes): with UNIQUE_AMOUNT_TAGGING, orders
+# with no screenshot after this long expire
+PAYMENT_EXPIRY_MINUTES = 60
 
 # ============================================================
 # CHANNEL SETTINGS
@@ -58,3 +59,143 @@ PREMIUM_CHANNEL_LINK = "https://t.me/+ElNqgNA939BlMDU1"
 
 # Link expiry time (hours)
 INVITE_LINK_EXPIRY_HOURS = 24
+
+# ============================================================
+# RECONCILIATION SETTINGS
+# ============================================================
+
+# Max hours between order creation and the statement credit
+RECONCILE_WINDOW_HOURS = 24
+
+# Approve matched orders immediately (False = ask admin first)
+RECONCILE_AUTO_APPLY = False
+
+# ============================================================
+# ADMIN LISTING SETTINGS
+# ============================================================
+
+# Members shown per /members page and /find result
+MEMBERS_PAGE_SIZE = 20
+
+# ============================================================
+# MEMBERSHIP AUDIT SETTINGS
+# ============================================================
+
+# Hours between channel membership audits (0 = disabled)
+AUDIT_INTERVAL_HOURS = 24
+
+# Members checked per batch / checked concurrently
+AUDIT_BATCH_SIZE = 100
+AUDIT_CONCURRENCY = 5
+
+# Pause between batches (seconds) to stay under Bot API limits
+AUDIT_BATCH_DELAY_SECONDS = 2
+
+# ============================================================
+# FLOOD PROTECTION
+# ============================================================
+
+# Per-user limits on expensive actions: (burst, seconds per extra call)
+# e.g. (3, 30) = 3 taps at once, then 1 more every 30 seconds
+THROTTLE_RULES = {
+    'access': (3, 30),      # "Get Access" (renders + uploads QR)
+    'paid': (3, 30),        # "I Have Paid" (notifies admin)
+    'screenshot': (5, 60),  # Screenshot uploads (forwarded to admin)
+}
+
+# ============================================================
+# UPDATE INTAKE SETTINGS
+# ============================================================
+
+# Updates handled at the same time
+INTAKE_WORKERS = 4
+
+# Max waiting updates; beyond this, new button taps are dropped
+# (admin commands and screenshots are never dropped)
+INTAKE_MAX_QUEUED = 500
+
+# After downtime, drop backlog button taps on messages older than this
+# (payment taps - Get Access, I Have Paid - always run)
+STALE_CALLBACK_MINUTES = 10
+
+# ============================================================
+# APPROVAL RECOVERY SETTINGS
+# ============================================================
+
+# Minutes between retries of unfinished approvals (e.g. link not delivered)
+APPROVAL_RETRY_MINUTES = 10
+
+# Give up messaging a user after this many failed attempts
+APPROVAL_MAX_NOTIFY_ATTEMPTS = 5
+
+# ============================================================
+# LANGUAGE SETTINGS
+# ============================================================
+
+# Language for users whose Telegram language has no translation
+# (available: 'en', 'hi' - texts live in messages.py)
+DEFAULT_LANGUAGE = 'en'
+
+# ============================================================
+# BROADCAST SETTINGS
+# ============================================================
+
+# Messages per second across the whole broadcast
+# (Telegram allows ~30/s per bot; leave room for normal traffic)
+BROADCAST_RATE_PER_SECOND = 20
+
+# Messages in flight at the same time
+BROADCAST_CONCURRENCY = 10
+
+# Members per progress checkpoint
+BROADCAST_BATCH_SIZE = 100
+
+# ============================================================
+# DIAGNOSTICS SETTINGS
+# ============================================================
+
+# Log a warning when the event loop is blocked longer than this
+LOOP_LAG_THRESHOLD_MS = 200
+
+# Longest /profile run allowed
+PROFILE_MAX_SECONDS = 60
+
+# ============================================================
+# MULTI-BOT HOSTING (python multibot.py)
+# ============================================================
+
+# Several bots in one process. Each entry overrides the settings
+# above; anything not listed is shared. Data goes to data/<name>/
+# unless DATA_DIR is set. Leave empty when running bot.py directly.
+BOTS = [
+    # {
+    #     'name': 'fitness',
+    #     'TELEGRAM_BOT_TOKEN': "123456:ABC...",
+    #     'PREMIUM_CHANNEL_ID': -1001234567890,
+    #     'PREMIUM_CHANNEL_LINK': "https://t.me/+xxxx",
+    #     'BOT_NAME': "Fitness Premium",
+    #     'MEMBERSHIP_PRICE': 199,
+    # },
+]
+
+# ============================================================
+# REVIEWER ADMINS
+# ============================================================
+
+# More admins who review payment screenshots (chat IDs, as strings).
+# ADMIN_CHAT_ID is always a reviewer and keeps getting system alerts.
+ADMIN_CHAT_IDS = []
+
+# How new screenshots are shared out: 'least_loaded' or 'round_robin'
+REVIEW_ASSIGNMENT = 'least_loaded'
+
+# Minutes a reviewer has before the screenshot goes to someone else
+REVIEW_LEASE_MINUTES = 30
+
+# ============================================================
+# UNIQUE-AMOUNT TAGGING
+# ============================================================
+
+# Give each open order its own amount (₹109.01 ... ₹109.99) so a
+# bank statement credit matches an order by amount alone (/reconcile)
+UNIQUE_AMOUNT_TAGGING = False
@@ -0,0 +1,155 @@
+"""
+ORDER / MEMBER EXPORT
+=====================
+Streams orders or members to CSV or JSONL in chunks, filtered by an
+optional date range. Used by the bot's /export command and as an
+offline CLI against the data directory.
+
+CLI usage:
+    python export.py orders
+    python export.py orders 2026-02-01 2026-02-28 --format jsonl -o feb.jsonl
+    python export.py members --data-dir data
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+# Rows buffered before each write
+CHUNK_SIZE = 500
+
+EXPORT_FORMATS = ('csv', 'jsonl')
+
+# kind -> (key column, date field used for filtering, CSV columns)
+EXPORT_KINDS = {
+    'orders': ('order_id', 'created_at', [
+        'order_id', 'user_id', 'username', 'first_name', 'amount', 'status',
+        'created_at', 'screenshot_uploaded', 'screenshot_time', 'approved_at',
+        'rejected_at', 'invite_link', 'payment_reference',
+    ]),
+    'members': ('user_id', 'joined_at', [
+        'user_id', 'username', 'order_id', 'joined_at', 'active',
+    ]),
+}
+
+DATA_FILES = {
+    'orders': 'orders.json',
+    'members': 'members.json',
+}
+
+
+def parse_date_arg(value, end_of_day=False):
+    """Parse a YYYY-MM-DD[THH:MM] argument into epoch seconds"""
+    parsed = datetime.fromisoformat(value)
+    if end_of_day and len(value) <= 10:
+        parsed = parsed.replace(hour=23, minute=59, second=59)
+    return parsed.timestamp()
+
+
+def _record_time(value):
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
+
+
+def iter_records(db, kind, start=None, end=None, keys=None):
+    """Yield export rows for records within [start, end].
+
+    keys: optional snapshot of db keys, so the db can keep changing
+    while a worker thread iterates.
+    """
+    key_column, date_field, _ = EXPORT_KINDS[kind]
+    for key in (keys if keys is not None else db):
+        record = db.get(key)
+        if record is None:
+            continue
+        if start is not None or end is not None:
+            ts = _record_time(record.get(date_field))
+            if ts is None or (start is not None and ts < start) or (end is not None and ts > end):
+                continue
+        row = {key_column: key}
+        row.update(record.to_dict() if hasattr(record, 'to_dict') else record)
+        yield row
+
+
+def write_export(rows, kind, fmt, f, chunk_size=CHUNK_SIZE):
+    """Write rows to an open text file in chunks. Returns row count."""
+    _, _, columns = EXPORT_KINDS[kind]
+    count = 0
+    chunk = []
+
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+            if count % chunk_size == 0:
+                f.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        f.write(buffer.getvalue())
+    else:
+        for row in rows:
+            chunk.append(json.dumps(row, default=str, ensure_ascii=False))
+            count += 1
+            if len(chunk) >= chunk_size:
+                f.write("\n".join(chunk) + "\n")
+                chunk = []
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+
+    return count
+
+
+def export_to_tempfile(db, kind, fmt='csv', start=None, end=None, keys=None):
+    """Export to a temp file. Returns (path, row count); caller removes the file."""
+    fd, path = tempfile.mkstemp(prefix=f'{kind}_', suffix=f'.{fmt}')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            count = write_export(iter_records(db, kind, start, end, keys), kind, fmt, f)
+    except Exception:
+        os.remove(path)
+        raise
+    return path, count
+
+
+def main(argv=None):
+    """Offline export from the data directory"""
+    ap = argparse.ArgumentParser(description="Export orders or members as CSV/JSONL")
+    ap.add_argument('kind', choices=sorted(EXPORT_KINDS))
+    ap.add_argument('start', nargs='?', help="from date (YYYY-MM-DD)")
+    ap.add_argument('end', nargs='?', help="to date, inclusive (YYYY-MM-DD)")
+    ap.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+    ap.add_argument('--data-dir', default='data', help="data directory (default: data)")
+    ap.add_argument('-o', '--output', help="output file (default: stdout)")
+    args = ap.parse_args(argv)
+
+    start = parse_date_arg(args.start) if args.start else None
+    end = parse_date_arg(args.end, end_of_day=True) if args.end else None
+
+    with open(os.path.join(args.data_dir, DATA_FILES[args.kind]), 'r') as f:
+        db = json.load(f)
+
+    rows = iter_records(db, args.kind, start, end)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            count = write_export(rows, args.kind, args.format, f)
+    else:
+        count = write_export(rows, args.kind, args.format, sys.stdout)
+
+    print(f"Exported {count} {args.kind}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
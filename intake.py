@@ -0,0 +1,149 @@
+"""
+BACKLOG-AWARE UPDATE INTAKE
+===========================
+Update processor that decides which updates run first.
+
+- Priority classes: admin commands and screenshots before user button
+  taps (lower number = sooner)
+- A user's own updates still run in the order they were sent, so
+  "I Have Paid" is handled before the screenshot that follows it
+- While draining the backlog that built up during downtime, button
+  taps on messages older than stale_seconds are dropped (menus that
+  old are out of date); protected updates are never dropped, so a
+  classifier keeps taps that must run (payment steps) at or below
+  PROTECTED_PRIORITY
+- When more than max_queued updates are waiting, new low-priority
+  updates are dropped instead of growing the queue
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+# Priority classes
+PRIORITY_ADMIN = 0
+PRIORITY_SCREENSHOT = 1
+PRIORITY_NORMAL = 2
+PRIORITY_BUTTON = 3
+
+# Updates at or below this priority are never dropped
+PROTECTED_PRIORITY = PRIORITY_SCREENSHOT
+
+
+class PriorityUpdateProcessor(BaseUpdateProcessor):
+    """Priority queue in front of a fixed number of update workers"""
+
+    def __init__(self, classify, workers=4, max_queued=500, stale_seconds=600):
+        # Headroom above max_queued so protected updates are never stuck
+        # behind the base class semaphore; shedding keeps the real bound
+        super().__init__(max_concurrent_updates=workers + 2 * max_queued)
+        self.classify = classify
+        self.workers = workers
+        self.max_queued = max_queued
+        self.stale_seconds = stale_seconds
+        self.backlog_remaining = 0
+        self.shed = 0
+        self._active = 0
+        self._pending = 0
+        self._waiting = []
+        self._seq = itertools.count()
+        self._user_tails = {}
+
+    async def initialize(self):
+        """Nothing to allocate"""
+
+    async def shutdown(self):
+        """Wake anything still queued so its task can finish"""
+        for _, _, waiter in self._waiting:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiting.clear()
+
+    @property
+    def queued(self):
+        """Updates admitted but not started yet"""
+        return self._pending
+
+    def set_backlog(self, count):
+        """Number of updates Telegram had pending at startup"""
+        self.backlog_remaining = count
+        if count:
+            logger.info(f"📥 Draining backlog of {count} updates")
+
+    def _is_stale(self, update):
+        """Button tap on a message sent more than stale_seconds ago"""
+        query = getattr(update, 'callback_query', None)
+        if query is None or query.message is None:
+            return False
+        return time.time() - query.message.date.timestamp() > self.stale_seconds
+
+    async def _acquire(self, priority):
+        if self._active < self.workers and not self._waiting:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._seq), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Slot was handed over just before cancellation: pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self):
+        while self._waiting:
+            _, _, waiter = heapq.heappop(self._waiting)
+            if not waiter.done():
+                # Hand the worker slot straight to the next update
+                waiter.set_result(None)
+                return
+        self._active -= 1
+
+    async def do_process_update(self, update, coroutine):
+        """Run coroutine once its priority turn comes, or drop it"""
+        priority = self.classify(update)
+
+        stale = self.backlog_remaining > 0 and priority > PROTECTED_PRIORITY and self._is_stale(update)
+        if self.backlog_remaining > 0:
+            self.backlog_remaining -= 1
+            if self.backlog_remaining == 0:
+                logger.info(f"📥 Backlog drained ({self.shed} stale updates dropped)")
+
+        if stale or (priority > PROTECTED_PRIORITY and self._pending >= self.max_queued):
+            self.shed += 1
+            coroutine.close()
+            return
+
+        user = getattr(update, 'effective_user', None)
+        user_id = user.id if user else None
+        previous = self._user_tails.get(user_id) if user_id else None
+        done = asyncio.get_running_loop().create_future()
+        if user_id:
+            self._user_tails[user_id] = done
+
+        started = False
+        self._pending += 1
+        try:
+            if previous is not None:
+                await previous
+            await self._acquire(priority)
+            started = True
+            self._pending -= 1
+            try:
+                await coroutine
+            finally:
+                self._release()
+        finally:
+            if not started:
+                self._pending -= 1
+                coroutine.close()
+            done.set_result(None)
+            if user_id and self._user_tails.get(user_id) is done:
+                del self._user_tails[user_id]
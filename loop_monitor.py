@@ -0,0 +1,128 @@
+"""
+EVENT LOOP WATCHDOG + SAMPLING PROFILER
+=======================================
+Finds out what is making the bot slow.
+
+- LoopWatchdog: a coroutine ticks every `interval`; any extra delay is
+  loop lag (something blocked the loop: a big JSON write, QR render,
+  sync I/O). Lag over the threshold is logged with the handlers that
+  were running. A helper thread notices a stall *while it happens* and
+  logs the loop thread's stack, pointing at the blocking line.
+- profile(): samples every thread's stack with sys._current_frames()
+  for N seconds and returns folded stacks ("a;b;c count" lines), the
+  input format of flamegraph.pl and speedscope.app.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+# Stack lines logged for a stalled loop
+STALL_STACK_DEPTH = 8
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _fold(frame):
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ';'.join(labels)
+
+
+def profile(seconds, interval=0.005):
+    """Sample all threads for `seconds`. Returns (folded stacks, samples).
+
+    Blocking: run it in a worker thread.
+    """
+    me = threading.get_ident()
+    names = {}
+    counts = Counter()
+    samples = 0
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == me:
+                continue
+            if thread_id not in names:
+                names = {t.ident: t.name for t in threading.enumerate()}
+            name = names.get(thread_id, str(thread_id)).replace(';', ':')
+            counts[f"{name};{_fold(frame)}"] += 1
+        samples += 1
+        time.sleep(interval)
+
+    folded = '\n'.join(f"{stack} {count}" for stack, count in counts.most_common())
+    return folded + '\n', samples
+
+
+class LoopWatchdog:
+    """Measures event loop lag and reports what was running"""
+
+    def __init__(self, threshold=0.2, interval=0.1, active=None):
+        """active: {key: (handler name, started perf_counter)} of running handlers"""
+        self.threshold = threshold
+        self.interval = interval
+        self.active = active if active is not None else {}
+        self.max_lag = 0.0
+        self.stalls = 0
+        self._last_tick = time.monotonic()
+        self._loop_thread = None
+        self._stop = threading.Event()
+
+    def running_handlers(self):
+        """'name (N ms)' for each handler in progress"""
+        now = time.perf_counter()
+        return ', '.join(
+            f"{name} ({(now - started) * 1000:.0f} ms)" for name, started in list(self.active.values())
+        ) or 'none'
+
+    async def run(self):
+        """Tick forever; start with asyncio.create_task, stop by cancelling"""
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        threading.Thread(target=self._watch, name='loop-watchdog', daemon=True).start()
+        try:
+            while True:
+                started = time.monotonic()
+                self._last_tick = started
+                await asyncio.sleep(self.interval)
+                lag = time.monotonic() - started - self.interval
+                self.max_lag = max(self.max_lag, lag)
+                if lag > self.threshold:
+                    self.stalls += 1
+                    logger.warning(
+                        f"🐌 Event loop lagged {lag * 1000:.0f} ms "
+                        f"(handlers running: {self.running_handlers()})"
+                    )
+        finally:
+            self._stop.set()
+
+    def _watch(self):
+        """Thread: log the loop's stack while it is stalled"""
+        reported = None
+        while not self._stop.wait(self.threshold / 2):
+            tick = self._last_tick
+            if time.monotonic() - tick - self.interval <= self.threshold or tick == reported:
+                continue
+            reported = tick
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            stack = ''.join(traceback.format_stack(frame)[-STALL_STACK_DEPTH:])
+            logger.warning(
+                f"🐌 Event loop blocked (handlers running: {self.running_handlers()}), "
+                f"currently at:\n{stack}"
+            )
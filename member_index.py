@@ -0,0 +1,96 @@
+"""
+MEMBER INDEX
+============
+In-memory index over members_db for /members and /find.
+
+- Sorted user IDs for cursor pagination (bisect, no full scans)
+- Sorted (term, user_id) list over usernames and user IDs: a prefix
+  lookup is a bisect to the first match plus a walk over the matches,
+  and memory stays one entry per term
+"""
+
+import bisect
+import heapq
+
+# Sorts after any character a username or ID can contain
+TERM_END = '\uffff'
+
+
+def _terms(user_id, username):
+    terms = {str(user_id)}
+    if username:
+        terms.add(str(username).lstrip('@').lower())
+    return terms
+
+
+class MemberIndex:
+    """Sorted ID list + sorted term list over members"""
+
+    def __init__(self):
+        self._ids = []
+        self._entries = []
+        self._terms = {}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def build(self, members):
+        """Index a members_db-style dict {user_id: {'username': ...}}"""
+        for user_id, member in members.items():
+            user_id = int(user_id)
+            if user_id in self._terms:
+                self.remove(user_id)
+            else:
+                self._ids.append(user_id)
+            self._terms[user_id] = _terms(user_id, member.get('username'))
+            self._entries.extend((term, user_id) for term in self._terms[user_id])
+        # One sort instead of an insort per member
+        self._ids.sort()
+        self._entries.sort()
+
+    def add(self, user_id, username):
+        """Add or re-index a member"""
+        user_id = int(user_id)
+        if user_id in self._terms:
+            self.remove(user_id)
+        else:
+            bisect.insort(self._ids, user_id)
+
+        terms = _terms(user_id, username)
+        self._terms[user_id] = terms
+        for term in terms:
+            bisect.insort(self._entries, (term, user_id))
+
+    def remove(self, user_id):
+        """Drop a member's terms (keeps its cursor position)"""
+        user_id = int(user_id)
+        for term in self._terms.pop(user_id, ()):
+            i = bisect.bisect_left(self._entries, (term, user_id))
+            if i < len(self._entries) and self._entries[i] == (term, user_id):
+                del self._entries[i]
+
+    def page_after(self, cursor=None, size=20):
+        """IDs following cursor (exclusive); first page if cursor is None"""
+        start = 0 if cursor is None else bisect.bisect_right(self._ids, int(cursor))
+        return self._ids[start:start + size]
+
+    def page_before(self, cursor, size=20):
+        """IDs preceding cursor (exclusive)"""
+        end = bisect.bisect_left(self._ids, int(cursor))
+        return self._ids[max(0, end - size):end]
+
+    def has_after(self, user_id):
+        return bool(self._ids) and int(user_id) < self._ids[-1]
+
+    def has_before(self, user_id):
+        return bool(self._ids) and int(user_id) > self._ids[0]
+
+    def search(self, query, limit=20):
+        """IDs whose username or user ID starts with query"""
+        query = str(query).strip().lstrip('@').lower()
+        if not query:
+            return []
+
+        lo = bisect.bisect_left(self._entries, (query,))
+        hi = bisect.bisect_left(self._entries, (query + TERM_END,), lo)
+        return heapq.nsmallest(limit, {user_id for _, user_id in self._entries[lo:hi]})
@@ -0,0 +1,115 @@
+"""
+CHANNEL MEMBERSHIP AUDIT
+========================
+Walks members in batches and checks each one with get_chat_member.
+
+- Bounded concurrency per batch, pause between batches
+- RetryAfter (flood control) pauses every worker, then retries
+- Cursor checkpoint saved after each batch, so a restart resumes
+  where the last pass stopped instead of starting over
+"""
+
+import asyncio
+import logging
+import time
+
+from telegram.error import BadRequest, RetryAfter, TelegramError
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean "not in the channel"
+OUT_STATUSES = ('left', 'kicked')
+
+# Retries per member after flood control
+MAX_RETRIES = 3
+
+
+def new_state():
+    """Empty audit state (persisted as data/audit.json)"""
+    return {
+        'cursor': None,
+        'pass_started_at': None,
+        'last_finished_at': None,
+        'checked': 0,
+        'leavers': {},
+        'unauthorized': {},
+    }
+
+
+class FloodGate:
+    """Shared pause for all workers after a RetryAfter"""
+
+    def __init__(self):
+        self.resume_at = 0.0
+
+    async def wait(self):
+        delay = self.resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds):
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+
+async def check_member(bot, chat_id, user_id, semaphore, gate):
+    """Return the member's channel status, or None if it can't be checked"""
+    async with semaphore:
+        for _ in range(MAX_RETRIES):
+            await gate.wait()
+            try:
+                member = await bot.get_chat_member(chat_id=chat_id, user_id=int(user_id))
+                return member.status
+            except RetryAfter as e:
+                logger.warning(f"⏳ Audit rate limited, pausing {e.retry_after}s")
+                gate.pause(e.retry_after)
+            except BadRequest as e:
+                # "user not found": never joined the channel
+                if 'not found' in str(e).lower():
+                    return 'left'
+                logger.error(f"Audit check error for {user_id}: {e}")
+                return None
+            except TelegramError as e:
+                logger.error(f"Audit check error for {user_id}: {e}")
+                return None
+    return None
+
+
+async def run_audit_pass(bot, chat_id, page_after, on_status, state, save_state,
+                         batch_size=100, concurrency=5, batch_delay=2.0):
+    """Run (or resume) one audit pass over all members.
+
+    page_after(cursor, size) returns the next user IDs after cursor;
+    on_status(user_id, status) is called for each checked member;
+    save_state() persists state after every batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    gate = FloodGate()
+
+    if state.get('cursor') is None:
+        state['pass_started_at'] = time.time()
+        state['checked'] = 0
+    else:
+        logger.info(f"🔎 Resuming membership audit after user {state['cursor']}")
+
+    while True:
+        batch = page_after(state.get('cursor'), batch_size)
+        if not batch:
+            break
+
+        statuses = await asyncio.gather(*(
+            check_member(bot, chat_id, user_id, semaphore, gate) for user_id in batch
+        ))
+        for user_id, status in zip(batch, statuses):
+            if status is not None:
+                on_status(user_id, status)
+
+        state['cursor'] = batch[-1]
+        state['checked'] += len(batch)
+        save_state()
+
+        await asyncio.sleep(batch_delay)
+
+    state['cursor'] = None
+    state['last_finished_at'] = time.time()
+    save_state()
+    logger.info(f"🔎 Membership audit finished: {state['checked']} checked, {len(state['leavers'])} leavers")
@@ -0,0 +1,520 @@
+"""
+MESSAGE CATALOG
+===============
+User-facing texts and keyboards, per language.
+
+- Templates are compiled once (at startup and on config reload):
+  config values (bot name, price, admin...) are substituted and
+  Markdown-escaped up front, leaving only per-user fields to fill in
+- Static keyboards are built once per language and reused
+- Language comes from the user's Telegram language_code; anything
+  not translated falls back to English
+
+Add a language by adding a block to TEXTS (missing keys use English).
+"""
+
+from string import Formatter
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+DEFAULT_LOCALE = 'en'
+
+# Fields inserted as-is (links, IDs inside `code` spans)
+RAW_FIELDS = frozenset(('invite_link', 'upi_id', 'order_id'))
+
+# Characters with meaning in Telegram legacy Markdown
+MARKDOWN_SPECIAL = ('\\', '_', '*', '`', '[')
+
+
+def escape_markdown(value):
+    """Escape text for parse_mode='Markdown'"""
+    text = str(value)
+    for char in MARKDOWN_SPECIAL:
+        text = text.replace(char, '\\' + char)
+    return text
+
+
+TEXTS = {
+    'en': {
+        'already_member': (
+            "✅ *You Already Have Access!*\n\n"
+            "🔗 Your link:\n{invite_link}\n\n"
+            "Contact: {admin_username}"
+        ),
+        'already_access': "✅ You already have access!",
+        'welcome': """
+🎉 *Welcome to {bot_name}!* 🎉
+
+Hello {first_name}! 👋
+
+Get *Lifetime Premium Access* for just *₹{price}*! 🚀
+
+✨ *What You'll Get:*
+• 📚 Exclusive premium content
+• ♾️ Lifetime access
+• 🎯 Fast approval (within hours)
+• 🔄 Regular updates
+
+💳 *Payment Process:*
+1️⃣ Click "Join Membership"
+2️⃣ Pay ₹{price} via UPI
+3️⃣ Send payment screenshot
+4️⃣ Admin approves
+5️⃣ Get instant access!
+
+Ready to join? 👇
+""",
+        'how_it_works': """
+❓ *How It Works*
+
+*Step 1: Join Membership*
+Click "Join Membership" button
+
+*Step 2: Get QR Code*
+Click "Get Access Now" to see payment QR
+
+*Step 3: Pay via UPI*
+Scan QR with any UPI app and pay ₹{price}
+
+*Step 4: Send Screenshot*
+Click "✅ I Have Paid" and send payment screenshot
+
+*Step 5: Admin Approval*
+Admin verifies payment (usually within 1-2 hours)
+
+*Step 6: Get Access*
+After approval, you get one-time invite link
+
+*Step 7: Join Channel*
+Click link and join premium channel!
+
+⚡ *Safe & Secure!* Admin verifies every payment.
+
+🔒 *One-time links* - Cannot be shared.
+""",
+        'plan': """
+💎 *LIFETIME MEMBERSHIP* 💎
+
+*Price: ₹{price}* (One-time)
+
+✅ *Included:*
+• 📚 All premium content
+• ♾️ Lifetime access
+• ⚡ Fast approval
+• 🎯 Priority support
+• 🔄 Updates
+
+💳 *Payment:*
+• Secure UPI
+• Any UPI app works
+• Screenshot verification
+• Admin approval
+
+🔒 *Security:*
+• Manual verification
+• One-time links
+• {expiry_hours}h validity
+• Safe & secure
+
+Ready?
+""",
+        'qr_error': "❌ Error! Contact: {admin_username}",
+        'payment': """
+💳 *PAYMENT DETAILS*
+
+📋 *Order ID:* `{order_id}`
+💰 *Amount:* ₹{amount}
+
+*📱 INSTRUCTIONS:*
+
+1️⃣ Scan QR code with UPI app
+2️⃣ Pay ₹{amount}
+3️⃣ Take screenshot of payment
+4️⃣ Click "✅ I Have Paid" below
+5️⃣ Send screenshot to bot
+6️⃣ Wait for admin approval
+
+*⏰ Approval Time:* 1-2 hours
+
+*UPI ID:* `{upi_id}`
+
+*Need help?* {admin_username}
+""",
+        'order_not_found': "❌ Order not found!",
+        'not_your_order': "❌ Not your order!",
+        'already_approved': "✅ Already approved!",
+        'send_screenshot': """
+📸 *SEND PAYMENT SCREENSHOT*
+
+Please send a clear screenshot of your payment.
+
+*Order ID:* `{order_id}`
+*Amount:* ₹{amount}
+
+⏳ *After sending:*
+Admin will verify and approve within 1-2 hours.
+
+*Need help?* {admin_username}
+""",
+        'screenshot_received': (
+            "✅ *Screenshot Received!*\n\n"
+            "📋 Order: `{order_id}`\n\n"
+            "⏳ Your payment is under review.\n"
+            "Admin will approve within 1-2 hours.\n\n"
+            "You'll get a notification when approved!\n\n"
+            "Thank you for your patience! 🙏"
+        ),
+        'approved': """
+✅ *PAYMENT APPROVED - ACCESS GRANTED!* ✅
+
+🎉 Congratulations {first_name}!
+
+📋 *Order ID:* `{order_id}`
+💰 *Amount:* ₹{amount}
+✨ *Status:* Approved
+
+━━━━━━━━━━━━━━━━━━━━━━━━
+
+*🔗 YOUR EXCLUSIVE INVITE LINK:*
+
+{invite_link}
+
+━━━━━━━━━━━━━━━━━━━━━━━━
+
+*CLICK LINK TO JOIN CHANNEL NOW!*
+
+*🔒 IMPORTANT:*
+• Works ONLY ONCE
+• Valid for {expiry_hours} hours
+• Cannot be shared
+
+Welcome! 🚀
+""",
+        'rejected': (
+            "❌ *Payment Verification Failed*\n\n"
+            "Order: `{order_id}`\n\n"
+            "Your payment could not be verified.\n\n"
+            "Please contact admin: {admin_username}"
+        ),
+        'contact': """
+📞 *CONTACT ADMIN*
+
+Need help?
+
+👤 Admin: {admin_username}
+
+Click below to message:
+""",
+        'welcome_back': """
+🎉 *Welcome back, {first_name}!*
+
+Get Lifetime Access for ₹{price}! 🚀
+
+Ready to join? 👇
+""",
+        'btn_join': "🚀 Join Membership",
+        'btn_help': "ℹ️ How It Works",
+        'btn_help_plan': "❓ How It Works",
+        'btn_contact': "📞 Contact Admin",
+        'btn_get_started': "🚀 Get Started",
+        'btn_back': "🔙 Back",
+        'btn_get_access': "💳 Get Access - ₹{price}",
+        'btn_paid': "✅ I Have Paid",
+        'btn_message_admin': "💬 Message Admin",
+        'btn_join_channel': "🔗 Join Premium Channel",
+    },
+
+    'hi': {
+        'already_member': (
+            "✅ *आपके पास पहले से एक्सेस है!*\n\n"
+            "🔗 आपका लिंक:\n{invite_link}\n\n"
+            "संपर्क: {admin_username}"
+        ),
+        'already_access': "✅ आपके पास पहले से एक्सेस है!",
+        'welcome': """
+🎉 *{bot_name} में आपका स्वागत है!* 🎉
+
+नमस्ते {first_name}! 👋
+
+सिर्फ *₹{price}* में *लाइफटाइम प्रीमियम एक्सेस* पाएं! 🚀
+
+✨ *आपको क्या मिलेगा:*
+• 📚 एक्सक्लूसिव प्रीमियम कंटेंट
+• ♾️ लाइफटाइम एक्सेस
+• 🎯 जल्दी अप्रूवल (कुछ घंटों में)
+• 🔄 नियमित अपडेट
+
+💳 *पेमेंट प्रक्रिया:*
+1️⃣ "मेंबरशिप लें" पर क्लिक करें
+2️⃣ UPI से ₹{price} पे करें
+3️⃣ पेमेंट का स्क्रीनशॉट भेजें
+4️⃣ एडमिन अप्रूव करेंगे
+5️⃣ तुरंत एक्सेस पाएं!
+
+जुड़ने के लिए तैयार? 👇
+""",
+        'how_it_works': """
+❓ *यह कैसे काम करता है*
+
+*स्टेप 1: मेंबरशिप लें*
+"मेंबरशिप लें" बटन पर क्लिक करें
+
+*स्टेप 2: QR कोड पाएं*
+पेमेंट QR देखने के लिए "एक्सेस लें" पर क्लिक करें
+
+*स्टेप 3: UPI से पे करें*
+किसी भी UPI ऐप से QR स्कैन करके ₹{price} पे करें
+
+*स्टेप 4: स्क्रीनशॉट भेजें*
+"✅ मैंने पेमेंट कर दिया" पर क्लिक करके स्क्रीनशॉट भेजें
+
+*स्टेप 5: एडमिन अप्रूवल*
+एडमिन पेमेंट जांचेंगे (आमतौर पर 1-2 घंटे में)
+
+*स्टेप 6: एक्सेस पाएं*
+अप्रूवल के बाद आपको एक बार इस्तेमाल होने वाला इनवाइट लिंक मिलेगा
+
+*स्टेप 7: चैनल जॉइन करें*
+लिंक पर क्लिक करके प्रीमियम चैनल जॉइन करें!
+
+⚡ *सुरक्षित!* एडमिन हर पेमेंट की जांच करते हैं।
+
+🔒 *वन-टाइम लिंक* - शेयर नहीं किए जा सकते।
+""",
+        'plan': """
+💎 *लाइफटाइम मेंबरशिप* 💎
+
+*कीमत: ₹{price}* (एक बार)
+
+✅ *शामिल:*
+• 📚 सारा प्रीमियम कंटेंट
+• ♾️ लाइफटाइम एक्सेस
+• ⚡ जल्दी अप्रूवल
+• 🎯 प्राथमिकता सपोर्ट
+• 🔄 अपडेट
+
+💳 *पेमेंट:*
+• सुरक्षित UPI
+• कोई भी UPI ऐप
+• स्क्रीनशॉट से जांच
+• एडमिन अप्रूवल
+
+🔒 *सुरक्षा:*
+• मैनुअल जांच
+• वन-टाइम लिंक
+• {expiry_hours} घंटे वैधता
+• पूरी तरह सुरक्षित
+
+तैयार?
+""",
+        'qr_error': "❌ त्रुटि! संपर्क करें: {admin_username}",
+        'payment': """
+💳 *पेमेंट विवरण*
+
+📋 *ऑर्डर ID:* `{order_id}`
+💰 *राशि:* ₹{amount}
+
+*📱 निर्देश:*
+
+1️⃣ UPI ऐप से QR कोड स्कैन करें
+2️⃣ ₹{amount} पे करें
+3️⃣ पेमेंट का स्क्रीनशॉट लें
+4️⃣ नीचे "✅ मैंने पेमेंट कर दिया" दबाएं
+5️⃣ बॉट को स्क्रीनशॉट भेजें
+6️⃣ एडमिन अप्रूवल का इंतज़ार करें
+
+*⏰ अप्रूवल समय:* 1-2 घंटे
+
+*UPI ID:* `{upi_id}`
+
+*मदद चाहिए?* {admin_username}
+""",
+        'order_not_found': "❌ ऑर्डर नहीं मिला!",
+        'not_your_order': "❌ यह आपका ऑर्डर नहीं है!",
+        'already_approved': "✅ पहले से अप्रूव है!",
+        'send_screenshot': """
+📸 *पेमेंट स्क्रीनशॉट भेजें*
+
+कृपया अपने पेमेंट का साफ़ स्क्रीनशॉट भेजें।
+
+*ऑर्डर ID:* `{order_id}`
+*राशि:* ₹{amount}
+
+⏳ *भेजने के बाद:*
+एडमिन 1-2 घंटे में जांच कर अप्रूव करेंगे।
+
+*मदद चाहिए?* {admin_username}
+""",
+        'screenshot_received': (
+            "✅ *स्क्रीनशॉट मिल गया!*\n\n"
+            "📋 ऑर्डर: `{order_id}`\n\n"
+            "⏳ आपके पेमेंट की जांच हो रही है।\n"
+            "एडमिन 1-2 घंटे में अप्रूव करेंगे।\n\n"
+            "अप्रूव होते ही आपको सूचना मिलेगी!\n\n"
+            "धैर्य रखने के लिए धन्यवाद! 🙏"
+        ),
+        'approved': """
+✅ *पेमेंट अप्रूव - एक्सेस मिल गया!* ✅
+
+🎉 बधाई हो {first_name}!
+
+📋 *ऑर्डर ID:* `{order_id}`
+💰 *राशि:* ₹{amount}
+✨ *स्थिति:* अप्रूव
+
+━━━━━━━━━━━━━━━━━━━━━━━━
+
+*🔗 आपका एक्सक्लूसिव इनवाइट लिंक:*
+
+{invite_link}
+
+━━━━━━━━━━━━━━━━━━━━━━━━
+
+*अभी लिंक पर क्लिक करके चैनल जॉइन करें!*
+
+*🔒 ज़रूरी:*
+• सिर्फ एक बार काम करेगा
+• {expiry_hours} घंटे तक मान्य
+• शेयर नहीं किया जा सकता
+
+स्वागत है! 🚀
+""",
+        'rejected': (
+            "❌ *पेमेंट की पुष्टि नहीं हुई*\n\n"
+            "ऑर्डर: `{order_id}`\n\n"
+            "आपके पेमेंट की पुष्टि नहीं हो सकी।\n\n"
+            "कृपया एडमिन से संपर्क करें: {admin_username}"
+        ),
+        'contact': """
+📞 *एडमिन से संपर्क करें*
+
+मदद चाहिए?
+
+👤 एडमिन: {admin_username}
+
+मैसेज करने के लिए नीचे क्लिक करें:
+""",
+        'welcome_back': """
+🎉 *फिर से स्वागत है, {first_name}!*
+
+₹{price} में लाइफटाइम एक्सेस पाएं! 🚀
+
+जुड़ने के लिए तैयार? 👇
+""",
+        'btn_join': "🚀 मेंबरशिप लें",
+        'btn_help': "ℹ️ यह कैसे काम करता है",
+        'btn_help_plan': "❓ यह कैसे काम करता है",
+        'btn_contact': "📞 एडमिन से संपर्क",
+        'btn_get_started': "🚀 शुरू करें",
+        'btn_back': "🔙 वापस",
+        'btn_get_access': "💳 एक्सेस लें - ₹{price}",
+        'btn_paid': "✅ मैंने पेमेंट कर दिया",
+        'btn_message_admin': "💬 एडमिन को मैसेज करें",
+        'btn_join_channel': "🔗 प्रीमियम चैनल जॉइन करें",
+    },
+}
+
+# Static keyboards: rows of (label key, callback_data) or (label key, 'url:' + setting)
+KEYBOARDS = {
+    'main': [
+        [('btn_join', 'join')],
+        [('btn_help', 'help')],
+        [('btn_contact', 'contact')],
+    ],
+    'how_it_works': [
+        [('btn_get_started', 'join')],
+        [('btn_back', 'main')],
+    ],
+    'plan': [
+        [('btn_get_access', 'access')],
+        [('btn_help_plan', 'help')],
+        [('btn_back', 'main')],
+    ],
+    'back': [
+        [('btn_back', 'main')],
+    ],
+    'contact': [
+        [('btn_message_admin', 'url:admin_url')],
+        [('btn_back', 'main')],
+    ],
+}
+
+
+def _compile(template, static):
+    """Split a template into static text and per-call fields.
+
+    Fields found in static are substituted (and escaped) now.
+    """
+    parts = []
+    buffer = ''
+    for literal, field, spec, _ in Formatter().parse(template):
+        buffer += literal
+        if field is None:
+            continue
+        if field in static:
+            value = format(static[field], spec)
+            buffer += value if field in RAW_FIELDS else escape_markdown(value)
+        else:
+            if buffer:
+                parts.append(buffer)
+                buffer = ''
+            parts.append((field, spec))
+    if buffer:
+        parts.append(buffer)
+    return tuple(parts)
+
+
+def _render(parts, fields):
+    out = []
+    for part in parts:
+        if part.__class__ is str:
+            out.append(part)
+        else:
+            name, spec = part
+            value = format(fields[name], spec)
+            out.append(value if name in RAW_FIELDS else escape_markdown(value))
+    return ''.join(out)
+
+
+class Catalog:
+    """Compiled templates and keyboards for every locale"""
+
+    def __init__(self, settings, default_locale=DEFAULT_LOCALE):
+        """settings: config values usable in any template"""
+        self.static = dict(settings)
+        self.default_locale = default_locale if default_locale in TEXTS else DEFAULT_LOCALE
+        self.templates = {}
+        self.keyboards = {}
+
+        for locale, texts in TEXTS.items():
+            merged = {**TEXTS[DEFAULT_LOCALE], **texts}
+            self.templates[locale] = {
+                key: _compile(text, self.static) for key, text in merged.items()
+            }
+
+        for locale in self.templates:
+            self.keyboards[locale] = {
+                name: InlineKeyboardMarkup([
+                    [self._button(locale, label, target) for label, target in row]
+                    for row in rows
+                ])
+                for name, rows in KEYBOARDS.items()
+            }
+
+    def _button(self, locale, label, target):
+        if target.startswith('url:'):
+            return InlineKeyboardButton(self.text(locale, label), url=self.static[target[4:]])
+        return InlineKeyboardButton(self.text(locale, label), callback_data=target)
+
+    def locale_for(self, language_code):
+        """Best locale for a Telegram language_code"""
+        code = (language_code or '').split('-')[0].lower()
+        return code if code in self.templates else self.default_locale
+
+    def text(self, locale, key, **fields):
+        """Render a template"""
+        return _render(self.templates[locale][key], fields)
+
+    def keyboard(self, locale, name):
+        """Prebuilt static keyboard"""
+        return self.keyboards[locale][name]
@@ -0,0 +1,124 @@
+"""
+MULTI-BOT HOSTING
+=================
+Runs several membership bots (different tokens, channels, prices)
+in one process, on one event loop.
+
+- Each entry of BOTS in config.py is one bot: its settings override
+  config.py, anything not given is inherited
+- bot.py is loaded once per bot as its own module, so every bot has
+  its own databases, catalog and handlers
+- Data is namespaced per bot: data/<name>/ unless DATA_DIR is given
+- Process-wide workers (QR rendering) are shared via shared.py
+
+Usage:
+    python multibot.py
+"""
+
+import asyncio
+import importlib.util
+import logging
+import os
+import signal
+import sys
+
+BOT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bot.py')
+
+logger = logging.getLogger(__name__)
+
+
+def load_bot(settings):
+    """Load a separate copy of bot.py configured with settings"""
+    name = settings['name']
+    overrides = {key: value for key, value in settings.items() if key != 'name'}
+    overrides.setdefault('DATA_DIR', os.path.join('data', name))
+
+    spec = importlib.util.spec_from_file_location(f"bot_{name}", BOT_FILE)
+    module = importlib.util.module_from_spec(spec)
+    module.BOT_OVERRIDES = overrides
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+async def run_bots(modules):
+    """Start every bot, run until SIGINT/SIGTERM, then stop them all"""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            pass
+
+    initialized = []
+    try:
+        for module in modules:
+            application = module.build_application()
+            await application.initialize()
+            initialized.append(application)
+            if application.post_init:
+                await application.post_init(application)
+            await application.updater.start_polling(allowed_updates=module.ALLOWED_UPDATES)
+            await application.start()
+            logger.info(f"✅ {module.BOT_NAME} started (data: {module.DATA_DIR})")
+
+        await stop.wait()
+    finally:
+        for application in reversed(initialized):
+            try:
+                if application.updater.running:
+                    await application.updater.stop()
+                if application.running:
+                    await application.stop()
+                if application.post_shutdown:
+                    await application.post_shutdown(application)
+                await application.shutdown()
+            except Exception as e:
+                logger.error(f"Shutdown error: {e}")
+
+
+def main():
+    """Load every bot in BOTS and run them together"""
+    try:
+        import config
+    except ImportError:
+        print("❌ Error: config.py not found!")
+        return 1
+
+    bots = getattr(config, 'BOTS', [])
+    if not bots:
+        print("❌ No bots configured: add entries to BOTS in config.py")
+        return 1
+
+    names = [settings.get('name') for settings in bots]
+    if None in names or len(set(names)) != len(names):
+        print("❌ Every entry in BOTS needs a unique 'name'")
+        return 1
+
+    modules = []
+    for settings in bots:
+        module = load_bot(settings)
+        if not module.validate_config():
+            print(f"❌ Bot '{settings['name']}' has configuration errors")
+            return 1
+        modules.append(module)
+
+    tokens = [module.TELEGRAM_BOT_TOKEN for module in modules]
+    if len(set(tokens)) != len(tokens):
+        print("❌ Two bots share a TELEGRAM_BOT_TOKEN")
+        return 1
+
+    print("\n" + "="*70)
+    print(f"🚀 HOSTING {len(modules)} MEMBERSHIP BOTS")
+    print("="*70)
+    for module in modules:
+        print(f"   🤖 {module.BOT_NAME}: ₹{module.MEMBERSHIP_PRICE} → {module.PREMIUM_CHANNEL_ID} ({module.DATA_DIR})")
+    print("="*70 + "\n")
+
+    asyncio.run(run_bots(modules))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
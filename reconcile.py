@@ -0,0 +1,354 @@
+"""
+UPI STATEMENT RECONCILIATION
+============================
+Matches credits from an exported bank/UPI statement CSV against
+open orders so payments can be approved in bulk.
+
+Matching order:
+1. "Order ORD..." note (the tn= field from create_upi_string)
+2. Amount + time window (only when exactly one order fits)
+
+Credits that already paid for a closed order (its ID in the note, or
+the UTR of an approved order) are reported as settled, never matched.
+
+Open orders are pending ones plus expired ones (the user may have paid
+but never sent a screenshot).
+
+The statement is streamed row by row; open orders are indexed by
+order ID and by amount (sorted by creation time) so each row costs a
+dict lookup plus a bisect, never a scan of all orders.
+
+CLI usage (read-only, never modifies data/):
+    python reconcile.py statement.csv
+    python reconcile.py statement.csv --orders data/orders.json --window-hours 48
+    python reconcile.py statement.csv --json
+"""
+
+import argparse
+import bisect
+import csv
+import json
+import re
+from datetime import datetime, timedelta
+
+from dateutil import parser as date_parser
+
+# Default matching window (hours after order creation)
+DEFAULT_WINDOW_HOURS = 24
+
+# Max unmatched/ambiguous rows listed in a summary
+SUMMARY_LIMIT = 10
+
+# Order statuses a statement credit can still pay for
+OPEN_STATUSES = ('pending', 'expired')
+
+ORDER_ID_RE = re.compile(r'ORD\d{6,}')
+
+# Recognised statement headers (lowercased)
+DATE_COLUMNS = ('transaction date', 'txn date', 'date', 'value date', 'date/time', 'timestamp', 'time')
+CREDIT_COLUMNS = ('credit', 'credit amount', 'deposit', 'deposit amt.', 'deposits', 'cr amount')
+AMOUNT_COLUMNS = ('amount', 'transaction amount', 'txn amount', 'amount (inr)', 'amt')
+TYPE_COLUMNS = ('type', 'dr/cr', 'cr/dr', 'transaction type', 'txn type')
+NOTE_COLUMNS = ('description', 'narration', 'remarks', 'note', 'details', 'particulars', 'message')
+REFERENCE_COLUMNS = ('utr', 'upi ref', 'upi ref no', 'reference', 'ref no', 'ref no./cheque no.', 'transaction id', 'ref')
+
+
+def to_paise(value):
+    """Parse an amount ('₹1,09.00', '109 CR', 109) into integer paise"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(round(value * 100))
+    text = str(value).upper().replace('₹', '').replace('INR', '').replace('RS.', '').replace(',', '')
+    text = text.replace('CR', '').replace('DR', '').strip()
+    if not text:
+        return None
+    try:
+        return int(round(float(text) * 100))
+    except ValueError:
+        return None
+
+
+def parse_timestamp(value):
+    """Parse an ISO string or epoch number into epoch seconds"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(str(value)).timestamp())
+    except ValueError:
+        return None
+
+
+def parse_statement_time(value):
+    """Parse a statement date into an inclusive (start, end) epoch range.
+
+    Date-only values cover the whole day.
+    """
+    text = (value or '').strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            parsed = date_parser.parse(text, dayfirst=True)
+        except (ValueError, OverflowError):
+            return None
+    start = int(parsed.timestamp())
+    if ':' not in text:
+        return start, start + 86399
+    return start, start
+
+
+def _pick(header, candidates):
+    """Return the index of the first candidate column present in header"""
+    for name in candidates:
+        if name in header:
+            return header.index(name)
+    return None
+
+
+def _detect_columns(row):
+    """Map a header row to column indexes, or None if it isn't a header"""
+    header = [cell.strip().lower() for cell in row]
+    columns = {
+        'date': _pick(header, DATE_COLUMNS),
+        'credit': _pick(header, CREDIT_COLUMNS),
+        'amount': _pick(header, AMOUNT_COLUMNS),
+        'type': _pick(header, TYPE_COLUMNS),
+        'note': _pick(header, NOTE_COLUMNS),
+        'reference': _pick(header, REFERENCE_COLUMNS),
+    }
+    if columns['date'] is None or (columns['credit'] is None and columns['amount'] is None):
+        return None
+    return columns
+
+
+def _cell(row, index):
+    if index is None or index >= len(row):
+        return ''
+    return row[index].strip()
+
+
+def iter_credits(path):
+    """Stream credit rows from a statement CSV.
+
+    Skips any preamble before the header row (common in bank exports)
+    and yields one dict per credit.
+    """
+    with open(path, 'r', encoding='utf-8-sig', errors='replace', newline='') as f:
+        reader = csv.reader(f)
+        columns = None
+        for line_no, row in enumerate(reader, start=1):
+            if not any(cell.strip() for cell in row):
+                continue
+            if columns is None:
+                columns = _detect_columns(row)
+                continue
+
+            raw_amount = _cell(row, columns['amount'])
+            if columns['credit'] is not None:
+                paise = to_paise(_cell(row, columns['credit']))
+            else:
+                paise = to_paise(raw_amount)
+                kind = _cell(row, columns['type']).lower()
+                if kind and not kind.startswith('c'):
+                    paise = None
+                elif raw_amount.upper().rstrip().endswith('DR'):
+                    paise = None
+            if not paise or paise <= 0:
+                continue
+
+            time_range = parse_statement_time(_cell(row, columns['date']))
+            yield {
+                'line': line_no,
+                'paise': paise,
+                'time_range': time_range,
+                'date': _cell(row, columns['date']),
+                'note': _cell(row, columns['note']),
+                'reference': _cell(row, columns['reference']),
+            }
+
+    if columns is None:
+        raise ValueError("No statement header found (need a date and an amount/credit column)")
+
+
+def build_pending_index(orders):
+    """Index open orders by order ID and by amount.
+
+    Closed orders are kept by ID (with their status), and the payment
+    references of approved orders are collected, so a credit that
+    already paid for an order is never matched to another one.
+    """
+    by_id = {}
+    by_amount = {}
+    closed = {}
+    references = set()
+    for order_id, order in orders.items():
+        if order.get('status') not in OPEN_STATUSES:
+            closed[order_id] = order.get('status')
+            if order.get('status') == 'approved' and order.get('payment_reference'):
+                references.add(str(order['payment_reference']).strip())
+            continue
+        paise = to_paise(order.get('amount'))
+        created = parse_timestamp(order.get('created_at')) or 0
+        by_id[order_id] = (paise, created)
+        by_amount.setdefault(paise, []).append((created, order_id))
+    for entries in by_amount.values():
+        entries.sort()
+    return {'by_id': by_id, 'by_amount': by_amount, 'closed': closed, 'references': references}
+
+
+def _window_candidates(index, credit, window_seconds, matched):
+    entries = index['by_amount'].get(credit['paise'])
+    if not entries:
+        return []
+    if credit['time_range'] is None:
+        return [order_id for _, order_id in entries if order_id not in matched]
+    start, end = credit['time_range']
+    lo = bisect.bisect_left(entries, (start - window_seconds, ''))
+    hi = bisect.bisect_right(entries, (end, '￿'))
+    return [order_id for _, order_id in entries[lo:hi] if order_id not in matched]
+
+
+def match_statement(path, index, window_hours=DEFAULT_WINDOW_HOURS):
+    """Match statement credits to open orders.
+
+    Returns a dict with 'matches', 'ambiguous', 'unmatched', 'settled'
+    and counts. Settled credits paid for an order that is already
+    closed (by note or by reference) and are never matched by amount.
+    """
+    window_seconds = int(timedelta(hours=window_hours).total_seconds())
+    matched = set()
+    references = set(index.get('references', ()))
+    closed = index.get('closed', {})
+    result = {
+        'matches': [],
+        'ambiguous': [],
+        'unmatched': [],
+        'settled': [],
+        'credits': 0,
+    }
+
+    for credit in iter_credits(path):
+        result['credits'] += 1
+        order_id = None
+        method = None
+
+        # Same UTR as an approved order (overlapping exports)
+        if credit['reference'] and credit['reference'] in references:
+            credit['settled'] = f"ref {credit['reference']}"
+            result['settled'].append(credit)
+            continue
+
+        noted = ORDER_ID_RE.findall(credit['note'])
+        for candidate in noted:
+            entry = index['by_id'].get(candidate)
+            if entry and entry[0] == credit['paise'] and candidate not in matched:
+                order_id, method = candidate, 'note'
+                break
+
+        # Note names an order that is already closed: it paid for that one
+        if order_id is None:
+            settled = next((c for c in noted if c in closed or c in matched), None)
+            if settled:
+                credit['settled'] = f"{settled} ({closed.get(settled, 'matched above')})"
+                result['settled'].append(credit)
+                continue
+
+        if order_id is None:
+            candidates = _window_candidates(index, credit, window_seconds, matched)
+            if len(candidates) == 1:
+                order_id, method = candidates[0], 'amount'
+            elif len(candidates) > 1:
+                credit['candidates'] = candidates
+                result['ambiguous'].append(credit)
+                continue
+
+        if order_id is None:
+            result['unmatched'].append(credit)
+            continue
+
+        matched.add(order_id)
+        if credit['reference']:
+            references.add(credit['reference'])
+        result['matches'].append({
+            'order_id': order_id,
+            'method': method,
+            'amount': credit['paise'] / 100,
+            'date': credit['date'],
+            'reference': credit['reference'],
+            'line': credit['line'],
+        })
+
+    return result
+
+
+def format_summary(result, limit=SUMMARY_LIMIT):
+    """Plain-text summary of a reconciliation result"""
+    by_note = sum(1 for m in result['matches'] if m['method'] == 'note')
+    lines = [
+        "🧾 RECONCILIATION SUMMARY",
+        "",
+        f"Credits scanned: {result['credits']}",
+        f"✅ Matched: {len(result['matches'])} ({by_note} by note, {len(result['matches']) - by_note} by amount)",
+        f"⚠️ Ambiguous: {len(result['ambiguous'])}",
+        f"❓ Unmatched: {len(result['unmatched'])}",
+        f"🔁 Already settled: {len(result['settled'])}",
+    ]
+
+    if result['matches']:
+        lines += ["", "Matched:"]
+        for m in result['matches'][:limit]:
+            lines.append(f"• {m['order_id']} ← ₹{m['amount']:.2f} {m['date']} [{m['method']}]")
+        if len(result['matches']) > limit:
+            lines.append(f"  … and {len(result['matches']) - limit} more")
+
+    if result['ambiguous']:
+        lines += ["", "Ambiguous (several orders fit):"]
+        for c in result['ambiguous'][:limit]:
+            lines.append(f"• line {c['line']}: ₹{c['paise'] / 100:.2f} {c['date']} → {', '.join(c['candidates'][:3])}")
+
+    if result['settled']:
+        lines += ["", "Already settled (not matched again):"]
+        for c in result['settled'][:limit]:
+            lines.append(f"• line {c['line']}: ₹{c['paise'] / 100:.2f} {c['date']} → {c['settled']}")
+        if len(result['settled']) > limit:
+            lines.append(f"  … and {len(result['settled']) - limit} more")
+
+    if result['unmatched']:
+        lines += ["", "Unmatched credits:"]
+        for c in result['unmatched'][:limit]:
+            lines.append(f"• line {c['line']}: ₹{c['paise'] / 100:.2f} {c['date']} {c['note'][:40]}")
+        if len(result['unmatched']) > limit:
+            lines.append(f"  … and {len(result['unmatched']) - limit} more")
+
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Offline reconciliation report"""
+    ap = argparse.ArgumentParser(description="Match a UPI/bank statement CSV against open orders")
+    ap.add_argument('statement', help="exported statement CSV")
+    ap.add_argument('--orders', default='data/orders.json', help="orders database (default: data/orders.json)")
+    ap.add_argument('--window-hours', type=float, default=DEFAULT_WINDOW_HOURS,
+                    help=f"max hours between order creation and payment (default: {DEFAULT_WINDOW_HOURS})")
+    ap.add_argument('--json', action='store_true', help="print matches as JSON")
+    args = ap.parse_args(argv)
+
+    with open(args.orders, 'r') as f:
+        orders = json.load(f)
+
+    result = match_statement(args.statement, build_pending_index(orders), args.window_hours)
+
+    if args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(format_summary(result, limit=len(result['matches']) + len(result['unmatched']) + len(result['settled'])))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,185 @@
+"""
+COMPACT ORDER / MEMBER RECORDS
+==============================
+Slotted record types used for orders_db and members_db in memory.
+
+- Fixed fields live in __slots__ (no per-record dict of repeated keys)
+- Timestamps are stored as epoch integers, so comparisons are int
+  compares instead of string parsing
+- Status values and user names are interned, so thousands of orders
+  share one "pending" string and one copy of each username
+- Records behave like dicts (order['status'], order.get(...), 'x' in
+  order) and serialise to the same JSON layout as before, with
+  ISO timestamps, so existing data files load and save unchanged
+"""
+
+import sys
+from datetime import datetime
+
+_MISSING = object()
+
+
+def to_epoch(value):
+    """ISO string / datetime / number -> epoch seconds (int)"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return int(datetime.fromisoformat(value).timestamp())
+
+
+def to_iso(epoch):
+    """Epoch seconds -> ISO string (None stays None)"""
+    if epoch is None:
+        return None
+    return datetime.fromtimestamp(epoch).isoformat()
+
+
+def format_time(value, fmt='%Y-%m-%d %H:%M'):
+    """Display a stored timestamp (epoch or ISO)"""
+    epoch = to_epoch(value) if value is not None else None
+    return datetime.fromtimestamp(epoch).strftime(fmt) if epoch is not None else 'N/A'
+
+
+class Record:
+    """Dict-like slotted record; subclasses declare FIELDS"""
+
+    __slots__ = ('_extra',)
+
+    FIELDS = ()
+    _field_set = frozenset()
+    TIME_FIELDS = frozenset()
+    INTERNED = frozenset()
+
+    def __init__(self, data=None, **fields):
+        self._extra = None
+        for source in (data or {}, fields):
+            for key, value in source.items():
+                self[key] = value
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build from a JSON-loaded dict"""
+        return cls(data)
+
+    def to_dict(self):
+        """JSON-compatible dict (ISO timestamps)"""
+        return {
+            key: to_iso(value) if key in self.TIME_FIELDS else value
+            for key, value in self.items()
+        }
+
+    def __setitem__(self, key, value):
+        if key in self.TIME_FIELDS:
+            value = to_epoch(value)
+        elif key in self.INTERNED and isinstance(value, str):
+            value = sys.intern(value)
+
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=_MISSING):
+        try:
+            value = self[key]
+        except KeyError:
+            if default is _MISSING:
+                raise
+            return default
+        del self[key]
+        return value
+
+    def keys(self):
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    __iter__ = keys
+
+    def items(self):
+        for key in self.keys():
+            yield key, self[key]
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+class OrderRecord(Record):
+    """One entry of orders_db"""
+
+    FIELDS = (
+        'user_id', 'username', 'first_name', 'amount', 'status', 'created_at',
+        'screenshot_uploaded', 'waiting_screenshot', 'screenshot_time',
+        'approved_at', 'rejected_at', 'invite_link', 'approval_state',
+        'notify_attempts', 'payment_reference', 'language',
+        'screenshot_file_id', 'screenshot_type', 'amount_tag', 'expired_at',
+    )
+    __slots__ = FIELDS
+    _field_set = frozenset(FIELDS)
+    TIME_FIELDS = frozenset(('created_at', 'screenshot_time', 'approved_at', 'rejected_at', 'expired_at'))
+    INTERNED = frozenset((
+        'username', 'first_name', 'status', 'approval_state', 'language', 'screenshot_type',
+    ))
+
+
+class MemberRecord(Record):
+    """One entry of members_db"""
+
+    FIELDS = ('username', 'order_id', 'joined_at', 'active', 'left_at', 'blocked')
+    __slots__ = FIELDS
+    _field_set = frozenset(FIELDS)
+    TIME_FIELDS = frozenset(('joined_at', 'left_at'))
+    INTERNED = frozenset(('username',))
+
+
+def load_records(data, record_type):
+    """{key: dict} -> {key: record}"""
+    return {key: record_type.from_dict(value) for key, value in data.items()}
+
+
+def json_default(value):
+    """json.dump hook: records serialise as their dict form"""
+    if isinstance(value, Record):
+        return value.to_dict()
+    return str(value)
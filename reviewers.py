@@ -0,0 +1,138 @@
+"""
+REVIEWER POOL
+=============
+Shares screenshot reviews between several admins.
+
+- Each new screenshot is assigned to one reviewer: least-loaded
+  (fewest open assignments) or round-robin
+- An assignment is a lease: if the reviewer hasn't decided when it
+  expires, the order is reassigned to someone else
+- Any admin may still decide any order; the lease only decides who
+  gets asked
+- Per-reviewer throughput (decisions, time from screenshot to
+  decision) is kept for /reviewers
+- Leases are saved with the stats, so a restart doesn't forget who
+  was asked (and the lease loop can still reassign)
+"""
+
+import time
+
+STRATEGIES = ('least_loaded', 'round_robin')
+
+
+def new_stats():
+    return {'approved': 0, 'rejected': 0, 'expired': 0, 'decision_seconds': 0}
+
+
+class ReviewerPool:
+    """Order -> reviewer leases"""
+
+    def __init__(self, reviewers, strategy='least_loaded', lease_seconds=1800, stats=None, clock=time.time):
+        self.strategy = strategy if strategy in STRATEGIES else STRATEGIES[0]
+        self.lease_seconds = lease_seconds
+        self.clock = clock
+        self.stats = stats if stats is not None else {}
+        self.leases = {}
+        self.load = {}
+        self._next = 0
+        self.reviewers = []
+        self.set_reviewers(reviewers)
+
+    def set_reviewers(self, reviewers):
+        """Replace the reviewer list; leases of removed reviewers expire now"""
+        self.reviewers = list(dict.fromkeys(str(r) for r in reviewers))
+        for reviewer in self.reviewers:
+            self.load.setdefault(reviewer, 0)
+            self.stats.setdefault(reviewer, new_stats())
+        now = self.clock()
+        for order_id, (reviewer, until) in list(self.leases.items()):
+            if reviewer not in self.reviewers:
+                self.leases[order_id] = (reviewer, min(until, now))
+
+    def export_leases(self):
+        """Leases as JSON-ready {order_id: [reviewer, until]}"""
+        return {order_id: [reviewer, until] for order_id, (reviewer, until) in self.leases.items()}
+
+    def restore_leases(self, leases):
+        """Reload saved leases; those of removed reviewers expire now"""
+        now = self.clock()
+        for order_id, (reviewer, until) in leases.items():
+            reviewer = str(reviewer)
+            if reviewer not in self.reviewers:
+                until = min(until, now)
+            self.release(order_id)
+            self.leases[order_id] = (reviewer, until)
+            self.load[reviewer] = self.load.get(reviewer, 0) + 1
+
+    def _pick(self, exclude):
+        candidates = [r for r in self.reviewers if r not in exclude] or self.reviewers
+        if not candidates:
+            return None
+        start = self._next % len(candidates)
+        ordered = candidates[start:] + candidates[:start]
+        if self.strategy == 'least_loaded':
+            choice = min(ordered, key=lambda r: self.load.get(r, 0))
+        else:
+            choice = ordered[0]
+        self._next = self.reviewers.index(choice) + 1
+        return choice
+
+    def assign(self, order_id, exclude=()):
+        """Lease order_id to a reviewer; returns the reviewer (or None)"""
+        self.release(order_id)
+        reviewer = self._pick(exclude)
+        if reviewer is not None:
+            self.leases[order_id] = (reviewer, self.clock() + self.lease_seconds)
+            self.load[reviewer] = self.load.get(reviewer, 0) + 1
+        return reviewer
+
+    def claim(self, order_id, reviewer):
+        """Reviewer picked the order up themselves (/review): renew to them"""
+        reviewer = str(reviewer)
+        current = self.leases.get(order_id)
+        if current and current[0] == reviewer:
+            self.leases[order_id] = (reviewer, self.clock() + self.lease_seconds)
+            return
+        self.release(order_id)
+        self.leases[order_id] = (reviewer, self.clock() + self.lease_seconds)
+        self.load[reviewer] = self.load.get(reviewer, 0) + 1
+
+    def release(self, order_id):
+        """Order decided (or gone): drop its lease"""
+        lease = self.leases.pop(order_id, None)
+        if lease and self.load.get(lease[0], 0) > 0:
+            self.load[lease[0]] -= 1
+
+    def assignee(self, order_id):
+        """Reviewer holding an unexpired lease on order_id, or None"""
+        lease = self.leases.get(order_id)
+        if lease and lease[1] > self.clock():
+            return lease[0]
+        return None
+
+    def expired(self):
+        """[(order_id, reviewer)] whose lease ran out"""
+        now = self.clock()
+        return [(order_id, reviewer) for order_id, (reviewer, until) in self.leases.items() if until <= now]
+
+    def reassign(self, order_id, previous):
+        """Lease ran out: count it against previous, lease to someone else"""
+        self.stats.setdefault(previous, new_stats())['expired'] += 1
+        return self.assign(order_id, exclude=(previous,))
+
+    def record(self, reviewer, outcome, seconds):
+        """Count a decision ('approved' / 'rejected') by reviewer"""
+        stats = self.stats.setdefault(str(reviewer), new_stats())
+        stats[outcome] += 1
+        stats['decision_seconds'] += max(0, int(seconds))
+
+    def summary(self):
+        """[(reviewer, open, approved, rejected, expired, avg decision minutes)]"""
+        rows = []
+        for reviewer in dict.fromkeys(self.reviewers + list(self.stats)):
+            stats = self.stats.get(reviewer, new_stats())
+            decided = stats['approved'] + stats['rejected']
+            avg = stats['decision_seconds'] / decided / 60 if decided else 0.0
+            rows.append((reviewer, self.load.get(reviewer, 0), stats['approved'],
+                         stats['rejected'], stats['expired'], avg))
+        return rows
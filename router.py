@@ -0,0 +1,248 @@
+"""
+CALLBACK & COMMAND ROUTER
+=========================
+Routing table for callback buttons, commands and messages, with
+middleware applied uniformly to every route.
+
+- callback_data is compact: "code|arg|arg" (Telegram allows 64 bytes)
+- Dispatch is one dict lookup; middleware chains are composed once
+  at install time, so adding routes or middleware doesn't slow it down
+- Old callback_data ("confirm_payment_ORD...") still routes, so
+  buttons already sitting in chats keep working
+
+Middleware signature:
+    async def middleware(route, update, context, call_next)
+"""
+
+import logging
+import time
+
+from telegram.ext import (
+    CallbackQueryHandler,
+    ChatMemberHandler,
+    CommandHandler,
+    MessageHandler,
+)
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = '|'
+
+# Callback data hard limit (bytes)
+MAX_CALLBACK_DATA = 64
+
+
+def encode(code, *args):
+    """Build callback_data from a route code and arguments"""
+    data = SEPARATOR.join((code,) + tuple(str(a) for a in args))
+    if len(data.encode('utf-8')) > MAX_CALLBACK_DATA:
+        raise ValueError(f"callback_data too long: {data}")
+    return data
+
+
+def decode(data):
+    """Split callback_data into (code, args)"""
+    code, *args = data.split(SEPARATOR)
+    return code, args
+
+
+class Route:
+    """One routing table entry"""
+
+    __slots__ = ('name', 'kind', 'handler', 'admin', 'throttle', 'filters', 'run')
+
+    def __init__(self, name, kind, handler, admin=False, throttle=None, filters=None):
+        self.name = name
+        self.kind = kind
+        self.handler = handler
+        self.admin = admin
+        self.throttle = throttle
+        self.filters = filters
+        self.run = None
+
+
+class Router:
+    """Routing table + middleware"""
+
+    def __init__(self):
+        self.middleware = []
+        self.callbacks = {}
+        self.legacy_exact = {}
+        self.legacy_prefixes = []
+        self.commands = []
+        self.messages = []
+        self.chat_members = []
+
+    def use(self, middleware):
+        """Add middleware (outermost first)"""
+        self.middleware.append(middleware)
+
+    def callback(self, code, handler, admin=False, throttle=None, legacy=None):
+        """Route callback_data with this code to handler(query, context, *args).
+
+        legacy: old callback_data this route used to have; a value ending
+        in '_' is treated as a prefix whose remainder is the argument.
+        """
+        self.callbacks[code] = Route(f"cb:{code}", 'callback', handler, admin, throttle)
+        if legacy and legacy.endswith('_'):
+            self.legacy_prefixes.append((legacy, code))
+        elif legacy:
+            self.legacy_exact[legacy] = code
+
+    def command(self, name, handler, admin=False, throttle=None):
+        """Route /name to handler(update, context)"""
+        self.commands.append(Route(f"/{name}", 'command', handler, admin, throttle))
+
+    def message(self, name, message_filter, handler, admin=False, throttle=None):
+        """Route messages matching message_filter to handler(update, context)"""
+        self.messages.append(Route(name, 'message', handler, admin, throttle, message_filter))
+
+    def chat_member(self, name, handler):
+        """Route chat_member updates to handler(update, context)"""
+        self.chat_members.append(Route(name, 'chat_member', handler))
+
+    def _resolve(self, data):
+        code, args = decode(data)
+        route = self.callbacks.get(code)
+        if route is not None:
+            return route, args
+        if data in self.legacy_exact:
+            return self.callbacks[self.legacy_exact[data]], []
+        for prefix, code in self.legacy_prefixes:
+            if data.startswith(prefix):
+                return self.callbacks[code], data[len(prefix):].split('_')
+        return None, []
+
+    def _compose(self, route, endpoint):
+        """Wrap endpoint in every middleware, innermost last"""
+        call = endpoint
+        for middleware in reversed(self.middleware):
+            call = self._bind(middleware, route, call)
+        return call
+
+    @staticmethod
+    def _bind(middleware, route, call_next):
+        async def call(update, context):
+            return await middleware(route, update, context, lambda: call_next(update, context))
+        return call
+
+    async def dispatch_callback(self, update, context):
+        """Single CallbackQueryHandler entry point"""
+        query = update.callback_query
+        route, args = self._resolve(query.data or '')
+        if route is None:
+            await query.answer()
+            return
+        context.route_args = args
+        await route.run(update, context)
+
+    def install(self, application):
+        """Register every route on the application"""
+        for route in self.callbacks.values():
+            route.run = self._compose(route, self._callback_endpoint(route))
+        application.add_handler(CallbackQueryHandler(self.dispatch_callback))
+
+        for route in self.commands:
+            route.run = self._compose(route, route.handler)
+            application.add_handler(CommandHandler(route.name[1:], route.run))
+
+        for route in self.messages:
+            route.run = self._compose(route, route.handler)
+            application.add_handler(MessageHandler(route.filters, route.run))
+
+        for route in self.chat_members:
+            route.run = self._compose(route, route.handler)
+            application.add_handler(ChatMemberHandler(route.run, ChatMemberHandler.CHAT_MEMBER))
+
+    @staticmethod
+    def _callback_endpoint(route):
+        async def endpoint(update, context):
+            query = update.callback_query
+            await query.answer()
+            await route.handler(query, context, *context.route_args)
+        return endpoint
+
+
+# ============================================================
+# MIDDLEWARE
+# ============================================================
+
+class Metrics:
+    """Per-route call count, errors and latency"""
+
+    def __init__(self):
+        self.routes = {}
+        # Handlers in progress: {key: (route name, started)}
+        self.active = {}
+
+    def record(self, name, seconds, failed):
+        stats = self.routes.get(name)
+        if stats is None:
+            stats = self.routes[name] = [0, 0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += failed
+        stats[2] += seconds
+        stats[3] = max(stats[3], seconds)
+
+    def summary(self):
+        """[(name, calls, errors, avg_ms, max_ms)] busiest first"""
+        rows = [
+            (name, calls, errors, total / calls * 1000, peak * 1000)
+            for name, (calls, errors, total, peak) in self.routes.items()
+        ]
+        return sorted(rows, key=lambda row: row[1], reverse=True)
+
+
+def timing(metrics):
+    """Record latency and failures of every route, and which are running"""
+    async def middleware(route, update, context, call_next):
+        started = time.perf_counter()
+        key = object()
+        metrics.active[key] = (route.name, started)
+        failed = True
+        try:
+            await call_next()
+            failed = False
+        finally:
+            del metrics.active[key]
+            metrics.record(route.name, time.perf_counter() - started, failed)
+    return middleware
+
+
+async def capture_errors(route, update, context, call_next):
+    """Log handler exceptions with the route and user that raised them"""
+    try:
+        await call_next()
+    except Exception as e:
+        user = update.effective_user
+        logger.error(f"Error in {route.name} (user {user.id if user else '-'}): {e}", exc_info=True)
+
+
+def admin_only(is_admin):
+    """Reject non-admins on routes marked admin=True"""
+    async def middleware(route, update, context, call_next):
+        if not route.admin:
+            return await call_next()
+        user = update.effective_user
+        if user and is_admin(user.id):
+            return await call_next()
+        if route.kind == 'command':
+            await update.message.reply_text("❌ Unauthorized!")
+        elif route.kind == 'callback':
+            await update.callback_query.answer("❌ Unauthorized!", show_alert=True)
+    return middleware
+
+
+def throttle(limiter):
+    """Drop calls from users exceeding limiter on routes with throttle set.
+
+    limiter.allow(route_key, user_id) -> bool
+    """
+    async def middleware(route, update, context, call_next):
+        user = update.effective_user
+        if not route.throttle or not user or limiter.allow(route.throttle, user.id):
+            return await call_next()
+        logger.info(f"🐢 Throttled {route.name} for user {user.id}")
+        if route.kind == 'callback':
+            await update.callback_query.answer("⏳ Please wait a moment...")
+    return middleware
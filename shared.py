@@ -0,0 +1,51 @@
+"""
+SHARED WORKERS
+==============
+Process-wide resources. When several bots run in one process
+(multibot.py), every copy of bot.py imports this same module, so
+they share these instead of each starting their own.
+"""
+
+import asyncio
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Threads rendering payment QR codes (CPU-bound PIL work)
+QR_WORKERS = 2
+
+_qr_executor = None
+
+
+def qr_executor():
+    """Thread pool for QR rendering, created on first use"""
+    global _qr_executor
+    if _qr_executor is None:
+        _qr_executor = ThreadPoolExecutor(max_workers=QR_WORKERS, thread_name_prefix='qr')
+    return _qr_executor
+
+
+_reload_callbacks = []
+
+
+def _run_reload_callbacks():
+    for callback in _reload_callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Reload error: {e}")
+
+
+def on_reload_signal(callback):
+    """Call callback on SIGHUP; one signal handler serves every bot"""
+    if callback in _reload_callbacks:
+        return
+    if not _reload_callbacks:
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _run_reload_callbacks)
+        except (AttributeError, NotImplementedError):
+            # No SIGHUP on this platform: /reload still works
+            return
+    _reload_callbacks.append(callback)
@@ -0,0 +1,63 @@
+"""
+PER-USER FLOOD PROTECTION
+=========================
+Token buckets keyed by (route, user).
+
+- Each rule is (burst, refill_seconds): a user may make `burst` calls
+  at once, then earns one more call every `refill_seconds`
+- A bucket left idle long enough to be full again carries no
+  information, so idle buckets are dropped in periodic sweeps and
+  memory stays proportional to currently active users
+"""
+
+import time
+
+# Seconds between idle-bucket sweeps
+SWEEP_INTERVAL = 60
+
+
+class TokenBucketLimiter:
+    """Per-(route, user) token buckets"""
+
+    def __init__(self, rules, clock=time.monotonic):
+        self.rules = dict(rules)
+        self.clock = clock
+        self.buckets = {}
+        self.next_sweep = clock() + SWEEP_INTERVAL
+
+    def allow(self, route_key, user_id):
+        """Take one token; False if the user is over the limit"""
+        rule = self.rules.get(route_key)
+        if rule is None:
+            return True
+        burst, refill_seconds = rule
+
+        now = self.clock()
+        if now >= self.next_sweep:
+            self.sweep(now)
+
+        key = (route_key, user_id)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = [burst - 1, now]
+            return True
+
+        tokens = min(burst, bucket[0] + (now - bucket[1]) / refill_seconds)
+        bucket[1] = now
+        if tokens < 1:
+            bucket[0] = tokens
+            return False
+        bucket[0] = tokens - 1
+        return True
+
+    def sweep(self, now=None):
+        """Drop buckets that have refilled completely"""
+        now = self.clock() if now is None else now
+        self.next_sweep = now + SWEEP_INTERVAL
+        idle = []
+        for key, (tokens, last) in self.buckets.items():
+            rule = self.rules.get(key[0])
+            if rule is None or now - last >= (rule[0] - tokens) * rule[1]:
+                idle.append(key)
+        for key in idle:
+            del self.buckets[key]